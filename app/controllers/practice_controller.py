@@ -2,6 +2,8 @@ from __future__ import annotations
 
 """Controller layer bridging UI events and business services."""
 
+from typing import NamedTuple
+
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from app.domain.models import PracticeConfig, SessionResult
@@ -10,10 +12,22 @@ from app.repositories.history_repository import HistoryRepository
 from app.services.session_service import SessionService
 
 
+class QuestionSnapshot(NamedTuple):
+    """Per-question display state emitted as one signal payload."""
+
+    expression: str
+    current: int
+    total: int
+    elapsed_seconds: int
+    correct_count: int
+    answered_count: int
+
+
 class PracticeController(QObject):
     """Translate UI actions into service calls and emit UI-friendly signals."""
 
-    question_changed = pyqtSignal(str, int, int, int, int, int)
+    # One object payload instead of six marshalled arguments per emission.
+    question_changed = pyqtSignal(object)
     answer_checked = pyqtSignal(bool, int, int, int)
     session_finished = pyqtSignal(object)
     history_loaded = pyqtSignal(object, str)
@@ -52,6 +66,8 @@ class PracticeController(QObject):
         except ValueError as exc:
             if str(exc) == "empty_answer":
                 self.error_raised.emit(self._localizer.tr("error_empty_answer"))
+            elif str(exc) == "bad_answer":
+                self.error_raised.emit(self._localizer.tr("error_invalid_answer"))
             else:
                 self.error_raised.emit(str(exc))
             return
@@ -92,10 +108,12 @@ class PracticeController(QObject):
         """Emit a normalized question payload for the practice page."""
         question = self._session_service.current_question()
         self.question_changed.emit(
-            question.expression,
-            self._session_service.current_index + 1,
-            self._session_service.total_questions,
-            self._session_service.elapsed_seconds(),
-            self._session_service.correct_count,
-            self._session_service.answered_count,
+            QuestionSnapshot(
+                expression=question.expression,
+                current=self._session_service.current_index + 1,
+                total=self._session_service.total_questions,
+                elapsed_seconds=self._session_service.elapsed_seconds(),
+                correct_count=self._session_service.correct_count,
+                answered_count=self._session_service.answered_count,
+            )
         )
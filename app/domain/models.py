@@ -5,8 +5,14 @@ from __future__ import annotations
 These dataclasses are intentionally UI-agnostic and persistence-agnostic.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+import json
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+try:
+    import orjson  # noqa: F401 - optional accelerated JSON parser
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 
 @dataclass(slots=True)
@@ -60,14 +66,69 @@ class AnswerRecord:
         )
 
 
-@dataclass(slots=True)
 class SessionResult:
-    """Final summary of a completed session for reporting and persistence."""
-
-    timestamp: str
-    username: str
-    score: int
-    total: int
-    accuracy: float
-    elapsed_seconds: int
-    details: list[AnswerRecord] = field(default_factory=list)
+    """Final summary of a completed session for reporting and persistence.
+
+    `details` materializes lazily — from a raw JSON blob or a repository
+    loader callback — so summary-only consumers (e.g. the history table)
+    never pay the decode or query cost.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "username",
+        "score",
+        "total",
+        "accuracy",
+        "elapsed_seconds",
+        "_details",
+        "_details_raw",
+        "_details_loader",
+    )
+
+    def __init__(
+        self,
+        timestamp: str,
+        username: str,
+        score: int,
+        total: int,
+        accuracy: float,
+        elapsed_seconds: int,
+        details: list[AnswerRecord] | None = None,
+        details_raw: str | bytes | None = None,
+        details_loader: Callable[[], list[AnswerRecord]] | None = None,
+    ) -> None:
+        self.timestamp = timestamp
+        self.username = username
+        self.score = score
+        self.total = total
+        self.accuracy = accuracy
+        self.elapsed_seconds = elapsed_seconds
+        self._details = details
+        self._details_raw = details_raw
+        self._details_loader = details_loader
+
+    @property
+    def details(self) -> list[AnswerRecord]:
+        """Answer records, fetched or decoded on first access."""
+        if self._details is None:
+            if self._details_loader is not None:
+                self._details = self._details_loader()
+            else:
+                self._details = [AnswerRecord.from_dict(item) for item in self._decode_raw()]
+        return self._details
+
+    @property
+    def details_raw(self) -> str | bytes | None:
+        """Undecoded JSON blob as loaded from storage, if any."""
+        return self._details_raw
+
+    def _decode_raw(self) -> list[dict]:
+        if not self._details_raw:
+            return []
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            data = loads(self._details_raw)
+        except ValueError:
+            return []
+        return data if isinstance(data, list) else []
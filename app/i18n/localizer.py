@@ -106,6 +106,7 @@ class Localizer(QObject):
                 "error_finish_failed": "结束练习失败: {error}",
                 "error_load_failed": "读取历史失败: {error}",
                 "error_empty_answer": "请输入答案",
+                "error_invalid_answer": "答案必须是整数",
             },
             "en_US": {
                 "app_title": "Arithmetic Practice Assistant",
@@ -198,6 +199,7 @@ class Localizer(QObject):
                 "error_finish_failed": "Failed to finish session: {error}",
                 "error_load_failed": "Failed to load history: {error}",
                 "error_empty_answer": "Please enter an answer",
+                "error_invalid_answer": "The answer must be an integer",
             },
         }
 
@@ -214,11 +216,20 @@ class Localizer(QObject):
         self._locale = locale
         self.locale_changed.emit(locale)
 
-    def tr(self, key: str, **kwargs) -> str:
-        """Translate key for current locale with optional format args."""
+    def tr_template(self, key: str) -> str:
+        """Return the raw format template for key in the current locale.
+
+        Hot refresh paths cache the template once per locale switch and
+        format it locally, skipping the per-call key lookup in `tr`.
+        """
         template = self._messages.get(self._locale, {}).get(key)
         if template is None:
             template = self._messages["en_US"].get(key, key)
+        return template
+
+    def tr(self, key: str, **kwargs) -> str:
+        """Translate key for current locale with optional format args."""
+        template = self.tr_template(key)
         try:
             return template.format(**kwargs)
         except Exception:
@@ -1,81 +1,158 @@
 from __future__ import annotations
 
-"""CSV-backed repository for session history."""
+"""SQLite-backed repository for session history."""
 
+import atexit
 import csv
 import json
+import sqlite3
+from functools import partial
 from pathlib import Path
 
 from app.domain.models import AnswerRecord, SessionResult
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    username TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    accuracy REAL NOT NULL,
+    elapsed_seconds INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    position INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    user_answer INTEGER,
+    correct_answer INTEGER NOT NULL,
+    is_correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_username ON sessions(username);
+CREATE INDEX IF NOT EXISTS idx_sessions_timestamp ON sessions(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_answers_session ON answers(session_id);
+"""
+
 
 class HistoryRepository:
-    """Persist and query `SessionResult` records from local CSV file."""
+    """Persist and query `SessionResult` records from a local SQLite database.
 
-    def __init__(self, csv_path: Path | None = None) -> None:
-        self._csv_path = csv_path or Path("data/history.csv")
-        self._csv_path.parent.mkdir(parents=True, exist_ok=True)
-        self._headers = [
-            "timestamp",
-            "username",
-            "score",
-            "total",
-            "accuracy",
-            "elapsed_seconds",
-            "details_json",
-        ]
-        if not self._csv_path.exists():
-            with self._csv_path.open("w", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=self._headers)
-                writer.writeheader()
+    Replaces the former CSV+JSON-blob storage: saves are small indexed
+    transactions and name lookups are WHERE clauses instead of full-file
+    parses. An existing `history.csv` is imported once on first run.
+    """
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        self._db_path = db_path or Path("data/history.db")
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._db_path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate_legacy_csv()
+        atexit.register(self._conn.close)
 
     def save_session(self, session: SessionResult) -> None:
-        """Append one finished session as a single CSV row."""
-        row = {
-            "timestamp": session.timestamp,
-            "username": session.username,
-            "score": session.score,
-            "total": session.total,
-            "accuracy": f"{session.accuracy:.2f}",
-            "elapsed_seconds": session.elapsed_seconds,
-            "details_json": json.dumps([item.to_dict() for item in session.details], ensure_ascii=False),
-        }
-        with self._csv_path.open("a", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=self._headers)
-            writer.writerow(row)
+        """Insert one finished session and its answers in a single transaction."""
+        cur = self._conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            cur.execute(
+                "INSERT INTO sessions (timestamp, username, score, total, accuracy, elapsed_seconds)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    session.timestamp,
+                    session.username,
+                    session.score,
+                    session.total,
+                    round(session.accuracy, 2),
+                    session.elapsed_seconds,
+                ),
+            )
+            session_id = cur.lastrowid
+            cur.executemany(
+                "INSERT INTO answers (session_id, position, question, user_answer, correct_answer, is_correct)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (session_id, idx, item.question, item.user_answer, item.correct_answer, int(item.is_correct))
+                    for idx, item in enumerate(session.details)
+                ],
+            )
+            cur.execute("COMMIT")
+        except sqlite3.Error:
+            cur.execute("ROLLBACK")
+            raise
+
+    def load_sessions(self, name_filter: str = "", limit: int | None = None) -> list[SessionResult]:
+        """Load sessions newest first, optionally filtered by name substring.
+
+        Ordering walks the descending timestamp index, so no sort happens at
+        read time; `limit` stops the scan after the N most recent sessions.
+        """
+        normalized = name_filter.strip()
+        query = (
+            "SELECT id, timestamp, username, score, total, accuracy, elapsed_seconds"
+            " FROM sessions"
+        )
+        params: list = []
+        if normalized:
+            escaped = normalized.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query += " WHERE username LIKE ? ESCAPE '\\'"
+            params.append(f"%{escaped}%")
+        query += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
-    def load_sessions(self, name_filter: str = "") -> list[SessionResult]:
-        """Load sessions, optionally filtered by case-insensitive name match."""
-        if not self._csv_path.exists():
-            return []
+        rows = self._conn.execute(query, params).fetchall()
+        # Positional construction: column order is fixed by the SELECT, so
+        # skip per-row kwargs dicts in this hot loop. Answers are fetched
+        # only when a session's .details is actually accessed (drill-in),
+        # so the list view never touches the answers table.
+        return [
+            SessionResult(
+                row[1], row[2], row[3], row[4], row[5], row[6],
+                details_loader=partial(self._load_session_answers, row[0]),
+            )
+            for row in rows
+        ]
+
+    def _load_session_answers(self, session_id: int) -> list[AnswerRecord]:
+        """Fetch the ordered answers of one session on demand."""
+        rows = self._conn.execute(
+            "SELECT question, user_answer, correct_answer, is_correct"
+            " FROM answers WHERE session_id = ? ORDER BY position",
+            (session_id,),
+        ).fetchall()
+        return [
+            AnswerRecord(question, user_answer, correct_answer, bool(is_correct))
+            for question, user_answer, correct_answer, is_correct in rows
+        ]
 
-        normalized = name_filter.strip().lower()
-        sessions: list[SessionResult] = []
-        with self._csv_path.open("r", newline="", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                username = str(row.get("username", ""))
-                if normalized and normalized not in username.lower():
-                    continue
+    def _migrate_legacy_csv(self) -> None:
+        """One-time import of the old data/history.csv, if present."""
+        legacy_path = self._db_path.with_name("history.csv")
+        if not legacy_path.exists():
+            return
+        if self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] > 0:
+            return
 
+        with legacy_path.open("r", newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
                 raw_details = row.get("details_json", "[]")
                 try:
                     details_data = json.loads(raw_details) if raw_details else []
                 except json.JSONDecodeError:
                     details_data = []
-
-                details = [AnswerRecord.from_dict(item) for item in details_data]
-                sessions.append(
+                self.save_session(
                     SessionResult(
                         timestamp=str(row.get("timestamp", "")),
-                        username=username,
+                        username=str(row.get("username", "")),
                         score=int(row.get("score", 0)),
                         total=int(row.get("total", 0)),
                         accuracy=float(row.get("accuracy", 0.0)),
                         elapsed_seconds=int(row.get("elapsed_seconds", 0)),
-                        details=details,
+                        details=[AnswerRecord.from_dict(item) for item in details_data],
                     )
                 )
-
-        sessions.sort(key=lambda item: item.timestamp, reverse=True)
-        return sessions
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+"""Run recognizer backends off the GUI thread via the global thread pool."""
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from app.services.recognizer_backend import RecognizerBackend
+
+
+class _RecognizeTask(QRunnable):
+    """One-shot task calling `backend.recognize` outside the event loop."""
+
+    def __init__(
+        self,
+        owner: "AsyncRecognizer",
+        backend: RecognizerBackend,
+        image: QImage,
+        seq: int,
+    ) -> None:
+        super().__init__()
+        self._owner = owner
+        self._backend = backend
+        self._image = image
+        self._seq = seq
+
+    def run(self) -> None:  # pragma: no cover - worker thread
+        try:
+            value = self._backend.recognize(self._image)
+        except Exception:  # noqa: BLE001 - backend failures mean "no result"
+            value = None
+        # Latest-wins: a newer recognize() call supersedes this result, so
+        # don't wake the GUI thread for it. Plain int read; worst case a
+        # just-superseded result still gets emitted, which callers already
+        # tolerate.
+        if self._seq == self._owner._seq:
+            self._owner.recognition_done.emit(value)
+
+
+class AsyncRecognizer(QObject):
+    """Dispatch `recognize()` calls on the thread pool and report via signal.
+
+    Cloud backends spend hundreds of milliseconds in HTTPS round-trips;
+    running them on `QThreadPool` keeps the Qt event loop responsive while
+    recognition is in flight. Results arrive on the GUI thread through
+    `recognition_done` (an ``int`` or ``None``).
+    """
+
+    recognition_done = pyqtSignal(object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._seq = 0
+
+    def recognize(self, backend: RecognizerBackend, image: QImage) -> None:
+        """Queue one recognition; only the latest request's result is emitted."""
+        self._seq += 1
+        QThreadPool.globalInstance().start(_RecognizeTask(self, backend, image, self._seq))
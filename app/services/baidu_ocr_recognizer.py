@@ -5,13 +5,14 @@ from __future__ import annotations
 import base64
 import json
 import logging
-import re
+import time
 import urllib.error
 import urllib.parse
-import urllib.request
+from pathlib import Path
 
 from PyQt5.QtGui import QImage
 
+from app.services import http_client
 from app.services.recognizer_backend import RecognizerBackend
 
 log = logging.getLogger(__name__)
@@ -19,6 +20,9 @@ log = logging.getLogger(__name__)
 _TOKEN_URL = "https://aip.baidubce.com/oauth/2.0/token"
 _HANDWRITING_URL = "https://aip.baidubce.com/rest/2.0/ocr/v1/handwriting"
 _TIMEOUT = 10
+_TOKEN_CACHE_PATH = Path("data/baidu_token.json")
+# Refresh slightly before the server-side expiry to avoid racing it.
+_TOKEN_EXPIRY_MARGIN = 60
 
 
 class BaiduOcrRecognizer(RecognizerBackend):
@@ -28,6 +32,7 @@ class BaiduOcrRecognizer(RecognizerBackend):
         self._api_key = api_key
         self._secret_key = secret_key
         self._access_token: str | None = None
+        self._token_expires_at = 0.0
 
     def recognize(self, image: QImage) -> int | None:
         token = self._ensure_access_token()
@@ -39,14 +44,13 @@ class BaiduOcrRecognizer(RecognizerBackend):
         b64 = base64.b64encode(png).decode("ascii")
         body = urllib.parse.urlencode({"image": b64}).encode("utf-8")
         try:
-            req = urllib.request.Request(
+            raw = http_client.post(
                 f"{_HANDWRITING_URL}?access_token={token}",
                 data=body,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
-                method="POST",
+                timeout=_TIMEOUT,
             )
-            with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
-                result: dict = json.loads(resp.read().decode("utf-8"))
+            result: dict = json.loads(raw.decode("utf-8"))
         except (urllib.error.URLError, OSError, json.JSONDecodeError) as exc:
             log.warning("Baidu OCR request failed: %s", exc)
             return None
@@ -61,8 +65,16 @@ class BaiduOcrRecognizer(RecognizerBackend):
         return bool(self._api_key and self._secret_key)
 
     def _ensure_access_token(self) -> str | None:
-        if self._access_token:
+        now = time.time()
+        if self._access_token and now < self._token_expires_at:
             return self._access_token
+
+        # Baidu tokens stay valid ~30 days; reuse one cached on disk so an
+        # app restart does not pay a network round-trip before recognising.
+        cached = self._load_cached_token()
+        if cached:
+            return cached
+
         params = urllib.parse.urlencode(
             {
                 "grant_type": "client_credentials",
@@ -71,24 +83,44 @@ class BaiduOcrRecognizer(RecognizerBackend):
             }
         )
         try:
-            url = f"{_TOKEN_URL}?{params}"
-            with urllib.request.urlopen(url, timeout=_TIMEOUT) as resp:
-                data: dict = json.loads(resp.read().decode("utf-8"))
+            raw = http_client.get(f"{_TOKEN_URL}?{params}", timeout=_TIMEOUT)
+            data: dict = json.loads(raw.decode("utf-8"))
             self._access_token = data.get("access_token")
         except (urllib.error.URLError, OSError, json.JSONDecodeError) as exc:
             log.warning("Baidu token request failed: %s", exc)
+            return self._access_token
+
+        if self._access_token:
+            self._token_expires_at = now + float(data.get("expires_in", 0)) - _TOKEN_EXPIRY_MARGIN
+            self._store_cached_token()
         return self._access_token
 
-    @staticmethod
-    def _extract_integer(result: dict) -> int | None:
-        words_result = result.get("words_result")
-        if not words_result:
+    def _load_cached_token(self) -> str | None:
+        try:
+            data = json.loads(_TOKEN_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
             return None
-        raw = " ".join(item.get("words", "") for item in words_result)
-        digits = re.sub(r"\D", "", raw)
-        if not digits:
+        token = data.get("token")
+        expires_at = float(data.get("expires_at", 0))
+        if not token or time.time() >= expires_at:
             return None
+        self._access_token = token
+        self._token_expires_at = expires_at
+        return token
+
+    def _store_cached_token(self) -> None:
         try:
-            return int(digits)
-        except ValueError:
+            _TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _TOKEN_CACHE_PATH.write_text(
+                json.dumps({"token": self._access_token, "expires_at": self._token_expires_at}),
+                encoding="utf-8",
+            )
+        except OSError as exc:  # pragma: no cover - best-effort cache
+            log.warning("Could not persist Baidu token cache: %s", exc)
+
+    @classmethod
+    def _extract_integer(cls, result: dict) -> int | None:
+        words_result = result.get("words_result")
+        if not words_result:
             return None
+        return cls._digits_to_int(item.get("words", "") for item in words_result)
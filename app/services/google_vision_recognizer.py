@@ -5,12 +5,11 @@ from __future__ import annotations
 import base64
 import json
 import logging
-import re
 import urllib.error
-import urllib.request
 
 from PyQt5.QtGui import QImage
 
+from app.services import http_client
 from app.services.recognizer_backend import RecognizerBackend
 
 log = logging.getLogger(__name__)
@@ -38,14 +37,13 @@ class GoogleVisionRecognizer(RecognizerBackend):
             ]
         }
         try:
-            req = urllib.request.Request(
+            raw = http_client.post(
                 f"{_ENDPOINT}?key={self._api_key}",
                 data=json.dumps(payload).encode("utf-8"),
                 headers={"Content-Type": "application/json"},
-                method="POST",
+                timeout=_TIMEOUT,
             )
-            with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
-                result: dict = json.loads(resp.read().decode("utf-8"))
+            result: dict = json.loads(raw.decode("utf-8"))
         except (urllib.error.URLError, OSError, json.JSONDecodeError) as exc:
             log.warning("Google Vision request failed: %s", exc)
             return None
@@ -59,8 +57,8 @@ class GoogleVisionRecognizer(RecognizerBackend):
     def available(self) -> bool:
         return bool(self._api_key)
 
-    @staticmethod
-    def _extract_integer(result: dict) -> int | None:
+    @classmethod
+    def _extract_integer(cls, result: dict) -> int | None:
         try:
             annotations = result["responses"][0].get("textAnnotations")
             if not annotations:
@@ -68,10 +66,4 @@ class GoogleVisionRecognizer(RecognizerBackend):
             raw = annotations[0].get("description", "")
         except (KeyError, IndexError):
             return None
-        digits = re.sub(r"\D", "", raw)
-        if not digits:
-            return None
-        try:
-            return int(digits)
-        except ValueError:
-            return None
+        return cls._digits_to_int((raw,))
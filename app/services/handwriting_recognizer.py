@@ -2,11 +2,15 @@ from __future__ import annotations
 
 """Sklearn-based local digit recognizer (fallback backend).
 
-Trains a small SVM classifier from ``sklearn.datasets.load_digits`` and
-performs vertical-projection segmentation to recognise multi-digit integers
-drawn on a canvas.
+Trains a small Nystroem + linear-SVM pipeline from
+``sklearn.datasets.load_digits`` and performs vertical-projection
+segmentation to recognise multi-digit integers drawn on a canvas.
 """
 
+import logging
+import pickle
+from pathlib import Path
+
 from PyQt5.QtGui import QImage
 
 from app.services.recognizer_backend import RecognizerBackend
@@ -17,15 +21,27 @@ except ImportError:  # pragma: no cover
     np = None  # type: ignore[assignment]
 
 try:
+    import sklearn
     from sklearn.datasets import load_digits
-    from sklearn.svm import SVC
+    from sklearn.kernel_approximation import Nystroem
+    from sklearn.pipeline import Pipeline
+    from sklearn.svm import LinearSVC
 except ImportError:  # pragma: no cover
+    sklearn = None  # type: ignore[assignment]
     load_digits = None  # type: ignore[assignment]
-    SVC = None  # type: ignore[assignment]
+    Nystroem = None  # type: ignore[assignment]
+    Pipeline = None  # type: ignore[assignment]
+    LinearSVC = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+_MODEL_CACHE_PATH = Path("data/svc.pkl")
+# Tag stored alongside the pickled model; bump when the pipeline changes.
+_MODEL_KIND = "nystroem-linearsvc"
 
 
 class HandwritingRecognizer(RecognizerBackend):
-    """Offline digit recognizer backed by an sklearn SVM on 8x8 patches."""
+    """Offline digit recognizer backed by an sklearn linear SVM on 8x8 patches."""
 
     _FOREGROUND_THRESHOLD = 200
     _MIN_REGION_AREA = 20
@@ -33,17 +49,28 @@ class HandwritingRecognizer(RecognizerBackend):
     _PADDING_RATIO = 0.3
 
     def __init__(self) -> None:
-        self._classifier = self._build_classifier()
+        # Training costs ~200ms; defer it until the first recognition so
+        # users who never draw a digit do not pay for it at startup.
+        self._classifier = None
+        self._classifier_ready = False
 
     # -- RecognizerBackend interface ----------------------------------------
 
     def recognize(self, image: QImage) -> int | None:
         if not self.available or np is None:
             return None
-        gray = self._qimage_to_grayscale_array(image)
-        if gray is None:
+        if self._get_classifier() is None:
+            return None
+        converted = self._qimage_to_grayscale_array(image)
+        if converted is None:
             return None
+        # The second element owns the pixel buffer the array views; it must
+        # stay referenced for as long as `gray` (and slices of it) are used.
+        gray, _buffer_owner = converted
 
+        # The mask is allocated per call: recognize() runs on thread-pool
+        # workers, and a buffer reused across overlapping recognitions
+        # would be overwritten mid-segmentation.
         foreground = gray < self._FOREGROUND_THRESHOLD
         if not foreground.any():
             return None
@@ -52,14 +79,13 @@ class HandwritingRecognizer(RecognizerBackend):
         if not boxes:
             return None
 
-        digits: list[str] = []
-        for x1, x2, y1, y2 in boxes:
-            patch = gray[y1:y2, x1:x2]
-            vector = self._prepare_patch_vector(patch)
-            predicted = int(self._classifier.predict([vector])[0])  # type: ignore[union-attr]
-            digits.append(str(predicted))
-
-        text = "".join(digits).lstrip("0") or "0"
+        # One predict() call over all digit patches: classification is a
+        # matrix op, so N rows in one call beat N single-row calls.
+        vectors = np.stack(
+            [self._prepare_patch_vector(gray[y1:y2, x1:x2]) for x1, x2, y1, y2 in boxes]
+        )
+        predictions = self._classifier.predict(vectors)  # type: ignore[union-attr]
+        text = "".join(str(int(value)) for value in predictions).lstrip("0") or "0"
         try:
             return int(text)
         except ValueError:
@@ -71,21 +97,67 @@ class HandwritingRecognizer(RecognizerBackend):
 
     @property
     def available(self) -> bool:
-        return self._classifier is not None
+        return np is not None and load_digits is not None and LinearSVC is not None
+
+    @property
+    def is_local(self) -> bool:
+        return True
 
     # -- Internal -----------------------------------------------------------
 
+    def _get_classifier(self):
+        """Return the trained classifier, building or loading it on first use."""
+        if not self._classifier_ready:
+            self._classifier_ready = True
+            self._classifier = self._load_cached_classifier() or self._build_classifier()
+        return self._classifier
+
     @staticmethod
     def _build_classifier():
-        if load_digits is None or SVC is None:
+        if load_digits is None or LinearSVC is None:
             return None
         data = load_digits()
-        clf = SVC(gamma=0.001)
+        # Nystroem approximates the RBF kernel up front so prediction is a
+        # single linear pass instead of evaluating every support vector.
+        clf = Pipeline(
+            [
+                ("features", Nystroem(gamma=0.001, n_components=100, random_state=0)),
+                ("svc", LinearSVC()),
+            ]
+        )
         clf.fit(data.data, data.target)
+        try:
+            _MODEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with _MODEL_CACHE_PATH.open("wb") as file:
+                pickle.dump(
+                    {"sklearn_version": sklearn.__version__, "kind": _MODEL_KIND, "model": clf},
+                    file,
+                )
+        except OSError as exc:  # pragma: no cover - best-effort cache
+            log.warning("Could not persist trained classifier: %s", exc)
         return clf
 
     @staticmethod
-    def _qimage_to_grayscale_array(image: QImage) -> np.ndarray | None:
+    def _load_cached_classifier():
+        """Load the pickled classifier if it matches this sklearn + pipeline."""
+        try:
+            with _MODEL_CACHE_PATH.open("rb") as file:
+                cached = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(cached, dict) or cached.get("sklearn_version") != sklearn.__version__:
+            return None
+        if cached.get("kind") != _MODEL_KIND:
+            return None
+        return cached.get("model")
+
+    @staticmethod
+    def _qimage_to_grayscale_array(image: QImage) -> tuple[np.ndarray, QImage] | None:
+        """Expose the grayscale pixels as an array view plus its buffer owner.
+
+        No full-image copy is made when the scanlines are tightly packed;
+        the returned QImage keeps the viewed buffer alive.
+        """
         if np is None:
             raise RuntimeError("numpy is required for handwriting recognition")
         gray = image.convertToFormat(QImage.Format_Grayscale8)
@@ -101,21 +173,17 @@ class HandwritingRecognizer(RecognizerBackend):
             buf_size = gray.byteCount()
         ptr.setsize(buf_size)
         arr = np.frombuffer(ptr, dtype=np.uint8).reshape((h, gray.bytesPerLine()))
-        return arr[:, :w].copy()
+        return np.ascontiguousarray(arr[:, :w]), gray
 
     def _segment_digit_regions(self, foreground: np.ndarray) -> list[tuple[int, int, int, int]]:
-        col_sum = foreground.sum(axis=0)
-        active = col_sum > 0
-        spans: list[tuple[int, int]] = []
-        start: int | None = None
-        for idx, val in enumerate(active):
-            if val and start is None:
-                start = idx
-            elif not val and start is not None:
-                spans.append((start, idx))
-                start = None
-        if start is not None:
-            spans.append((start, len(active)))
+        active = np.count_nonzero(foreground, axis=0) > 0
+        # Find runs of active columns in one vectorized pass: edges of the
+        # padded boolean array mark span starts (+1) and ends (-1).
+        padded = np.concatenate(([False], active, [False]))
+        edges = np.diff(padded.astype(np.int8))
+        starts = np.where(edges == 1)[0]
+        ends = np.where(edges == -1)[0]
+        spans = list(zip(starts.tolist(), ends.tolist()))
         if not spans:
             return []
 
@@ -124,7 +192,7 @@ class HandwritingRecognizer(RecognizerBackend):
         boxes: list[tuple[int, int, int, int]] = []
         for x1, x2 in spans:
             region = foreground[:, x1:x2]
-            rows = np.where(region.sum(axis=1) > 0)[0]
+            rows = np.where(np.count_nonzero(region, axis=1) > 0)[0]
             if rows.size == 0:
                 continue
             y1, y2 = int(rows[0]), int(rows[-1] + 1)
@@ -149,21 +217,23 @@ class HandwritingRecognizer(RecognizerBackend):
         return merged
 
     def _prepare_patch_vector(self, patch_gray: np.ndarray) -> np.ndarray:
-        ink = (255 - patch_gray).astype(np.float32)
-        if not np.any(ink > 0):
-            return np.zeros(64, dtype=np.float32)
+        # Stay in uint8 until the final 8x8 reduction: the centroid and the
+        # canvas fill are memory-bound, so 1 byte/pixel beats float32's 4.
+        ink = 255 - patch_gray
+        if not ink.any():
+            return np.zeros(64, dtype=np.int8)
 
         h, w = ink.shape
-        total = ink.sum()
+        total = int(ink.sum())
         if total > 0:
-            gy = float(np.sum(np.arange(h).reshape(-1, 1) * ink) / total)
-            gx = float(np.sum(np.arange(w).reshape(1, -1) * ink) / total)
+            gy = float(np.average(np.arange(h), weights=ink.sum(axis=1)))
+            gx = float(np.average(np.arange(w), weights=ink.sum(axis=0)))
         else:
             gy, gx = h / 2.0, w / 2.0
 
         side = max(h, w)
         padded = max(int(side * (1.0 + 2 * self._PADDING_RATIO)), 4)
-        canvas = np.zeros((padded, padded), dtype=np.float32)
+        canvas = np.zeros((padded, padded), dtype=np.uint8)
         center = padded / 2.0
         yo = max(0, min(int(round(center - gy)), padded - h))
         xo = max(0, min(int(round(center - gx)), padded - w))
@@ -172,20 +242,27 @@ class HandwritingRecognizer(RecognizerBackend):
         resized = self._resize_to_8(canvas)
         mx = float(np.max(resized))
         if mx <= 1e-6:
-            return np.zeros(64, dtype=np.float32)
-        return ((resized / mx) * 16.0).reshape(64)
+            return np.zeros(64, dtype=np.int8)
+        return ((resized / mx) * 16.0).reshape(64).astype(np.int8)
 
     @staticmethod
     def _resize_to_8(image: np.ndarray) -> np.ndarray:
         sh, sw = image.shape
         if sh == 8 and sw == 8:
             return image.copy()
+        # Average over the same linspace-tiled blocks as a per-cell
+        # slice/mean loop, but in two reduceat passes plus one divide.
+        # Tiling the image exactly (instead of zero-padding to a multiple
+        # of 8) keeps the features aligned with the load_digits training
+        # distribution for every patch size.
+        rb = np.linspace(0, sh, 9).astype(np.intp)
+        cb = np.linspace(0, sw, 9).astype(np.intp)
+        sums = np.add.reduceat(
+            np.add.reduceat(image.astype(np.float32), rb[:-1], axis=0), cb[:-1], axis=1
+        )
+        # Degenerate bands (patches smaller than 8 px) repeat a boundary;
+        # their area is 0 and the cell stays 0, as in the loop version.
+        areas = np.diff(rb)[:, None] * np.diff(cb)[None, :]
         out = np.zeros((8, 8), dtype=np.float32)
-        rb = np.linspace(0, sh, 9).astype(int)
-        cb = np.linspace(0, sw, 9).astype(int)
-        for r in range(8):
-            for c in range(8):
-                blk = image[rb[r] : rb[r + 1], cb[c] : cb[c + 1]]
-                if blk.size > 0:
-                    out[r, c] = blk.mean()
+        np.divide(sums, areas, out=out, where=areas > 0)
         return out
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+"""Shared HTTP helpers for cloud OCR backends.
+
+When `requests` is installed, calls go through one module-level
+`requests.Session`, so repeated recognitions reuse a keep-alive connection
+instead of paying a fresh TLS handshake each time. Without it, the helpers
+fall back to plain `urllib` with identical semantics.
+"""
+
+import urllib.request
+
+try:
+    import requests
+except ImportError:  # pragma: no cover
+    requests = None  # type: ignore[assignment]
+
+_session = requests.Session() if requests is not None else None
+
+
+def post(url: str, data: bytes, headers: dict[str, str], timeout: float) -> bytes:
+    """POST `data` and return the raw response body.
+
+    Raises `OSError` (which covers `requests` exceptions too) on failure.
+    """
+    if _session is not None:
+        response = _session.post(url, data=data, headers=headers, timeout=timeout)
+        return response.content
+    request = urllib.request.Request(url, data=data, headers=headers, method="POST")
+    with urllib.request.urlopen(request, timeout=timeout) as resp:
+        return resp.read()
+
+
+def get(url: str, timeout: float) -> bytes:
+    """GET `url` and return the raw response body."""
+    if _session is not None:
+        return _session.get(url, timeout=timeout).content
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        return resp.read()
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import io
 import logging
-import re
 
 from PyQt5.QtGui import QImage
 
@@ -34,18 +33,40 @@ class PaddleOcrRecognizer(RecognizerBackend):
     def recognize(self, image: QImage) -> int | None:
         if not self.available:
             return None
-        png = self._qimage_to_png_bytes(image)
-        if not png:
-            return None
-        try:
+        # Read the raw pixel buffer directly; PNG encode + PIL decode is only
+        # kept as a fallback when the buffer is not accessible.
+        arr = self._qimage_to_rgb_array(image)
+        if arr is None:
+            png = self._qimage_to_png_bytes(image)
+            if not png:
+                return None
             pil = PILImage.open(io.BytesIO(png)).convert("RGB")
             arr = np.array(pil)
+        try:
             results = self._ocr.ocr(arr, det=True, rec=True, cls=False)  # type: ignore[union-attr]
         except Exception as exc:  # noqa: BLE001
             log.warning("PaddleOCR recognition failed: %s", exc)
             return None
         return self._extract_integer(results)
 
+    @staticmethod
+    def _qimage_to_rgb_array(image: QImage) -> np.ndarray | None:
+        """Expose the QImage pixel buffer as an (h, w, 3) RGB array."""
+        rgb = image.convertToFormat(QImage.Format_RGB888)
+        w, h = rgb.width(), rgb.height()
+        if w <= 0 or h <= 0:
+            return None
+        ptr = rgb.bits()
+        if ptr is None:
+            return None
+        try:
+            buf_size = rgb.sizeInBytes()
+        except AttributeError:
+            buf_size = rgb.byteCount()
+        ptr.setsize(buf_size)
+        arr = np.frombuffer(ptr, dtype=np.uint8).reshape((h, rgb.bytesPerLine()))
+        return arr[:, : w * 3].reshape(h, w, 3).copy()
+
     @property
     def name(self) -> str:
         return "paddle-ocr"
@@ -54,6 +75,10 @@ class PaddleOcrRecognizer(RecognizerBackend):
     def available(self) -> bool:
         return self._ocr is not None
 
+    @property
+    def is_local(self) -> bool:
+        return True
+
     @staticmethod
     def _build_ocr():
         if PaddleOCR is None or np is None or PILImage is None:
@@ -79,11 +104,4 @@ class PaddleOcrRecognizer(RecognizerBackend):
                         texts.append(str(text_part[0]))
                     else:
                         texts.append(str(text_part))
-        raw = " ".join(texts)
-        digits = re.sub(r"\D", "", raw)
-        if not digits:
-            return None
-        try:
-            return int(digits)
-        except ValueError:
-            return None
+        return PaddleOcrRecognizer._digits_to_int(texts)
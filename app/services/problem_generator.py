@@ -5,79 +5,233 @@ from __future__ import annotations
 This module is pure business logic and can be unit-tested without PyQt.
 """
 
-import ast
 import random
+import re
 from fractions import Fraction
+from functools import lru_cache
 
 from app.domain.models import PracticeConfig, PracticeQuestion
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+_TOKEN_RE = re.compile(r"\d+|[()+\-*/]")
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "u-": 3}
+
 
 class ExpressionEvaluator:
-    """Safely evaluate arithmetic expressions using Python AST."""
-
-    def evaluate(self, expression: str) -> Fraction:
-        node = ast.parse(expression, mode="eval").body
-        return self._eval_node(node)
-
-    def _eval_node(self, node: ast.AST) -> Fraction:
-        if isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left)
-            right = self._eval_node(node.right)
-
-            if isinstance(node.op, ast.Add):
-                return left + right
-            if isinstance(node.op, ast.Sub):
-                return left - right
-            if isinstance(node.op, ast.Mult):
-                return left * right
-            if isinstance(node.op, ast.Div):
-                if right == 0:
-                    raise ZeroDivisionError("division by zero")
-                return left / right
-            raise ValueError("unsupported operator")
+    """Safely evaluate arithmetic expressions with a postfix stack machine.
+
+    Expressions compile once (shunting-yard) into a flat postfix program,
+    then run on a plain list stack in pure-int arithmetic, promoting to
+    `Fraction` only when a division leaves a remainder. Both the compiled
+    program and the result are memoized module-wide: the mixed-expression
+    generator regenerates many structurally identical strings, so repeat
+    evaluations are direct cache hits.
+    """
 
-        if isinstance(node, ast.Constant) and isinstance(node.value, int):
-            return Fraction(node.value, 1)
+    def evaluate(self, expression: str) -> Fraction | int:
+        return _evaluate_cached(expression)
 
-        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
-            value = self._eval_node(node.operand)
-            return -value
 
+@lru_cache(maxsize=4096)
+def _compile_postfix(expression: str) -> tuple:
+    """Tokenize and convert to a postfix opcode tuple, once per expression."""
+    tokens = _TOKEN_RE.findall(expression)
+    if "".join(tokens) != expression.replace(" ", ""):
         raise ValueError("unsupported expression")
 
+    output: list = []
+    stack: list[str] = []
+    prev = "op"  # sentinel so a leading '-' reads as unary
+    for token in tokens:
+        if token[0].isdigit():
+            output.append(int(token))
+            prev = "value"
+        elif token == "(":
+            stack.append(token)
+            prev = "op"
+        elif token == ")":
+            while stack and stack[-1] != "(":
+                output.append(stack.pop())
+            if not stack:
+                raise ValueError("unbalanced parentheses")
+            stack.pop()
+            prev = "value"
+        else:
+            if token == "-" and prev == "op":
+                token = "u-"  # right-associative: never pops
+            else:
+                precedence = _PRECEDENCE[token]
+                while stack and stack[-1] != "(" and _PRECEDENCE[stack[-1]] >= precedence:
+                    output.append(stack.pop())
+            stack.append(token)
+            prev = "op"
+
+    while stack:
+        if stack[-1] == "(":
+            raise ValueError("unbalanced parentheses")
+        output.append(stack.pop())
+    return tuple(output)
+
+
+def _eval_postfix(program: tuple) -> Fraction | int:
+    stack: list = []
+    push = stack.append
+    pop = stack.pop
+    try:
+        for op in program:
+            if type(op) is int:
+                push(op)
+            elif op == "+":
+                b = pop()
+                push(pop() + b)
+            elif op == "-":
+                b = pop()
+                push(pop() - b)
+            elif op == "*":
+                b = pop()
+                push(pop() * b)
+            elif op == "/":
+                b = pop()
+                a = pop()
+                if b == 0:
+                    raise ZeroDivisionError("division by zero")
+                quotient, remainder = divmod(a, b)
+                push(quotient if remainder == 0 else Fraction(a) / b)
+            else:  # "u-"
+                push(-pop())
+    except IndexError:
+        raise ValueError("unsupported expression") from None
+    if len(stack) != 1:
+        raise ValueError("unsupported expression")
+    return stack[0]
+
+
+@lru_cache(maxsize=4096)
+def _evaluate_cached(expression: str) -> Fraction | int:
+    """Evaluate with memoization; safe because evaluation is pure."""
+    return _eval_postfix(_compile_postfix(expression))
+
 
 class ProblemGenerator:
     """Generate arithmetic questions based on `PracticeConfig`."""
 
+    # Pool size multiplier: how many questions to pre-generate per distinct
+    # configuration so repeat sessions can sample without regenerating.
+    _POOL_FACTOR = 4
+
     def __init__(self) -> None:
-        self._evaluator = ExpressionEvaluator()
+        # Dedicated RNG: bound methods of an instance are cheaper to call
+        # than module-level random.* (no global + attribute lookup per draw).
+        self._rand = random.Random()
+        self._question_pool: dict[tuple, list[PracticeQuestion]] = {}
 
     def generate_questions(self, config: PracticeConfig) -> list[PracticeQuestion]:
-        """Generate a full question set for one session."""
-        questions: list[PracticeQuestion] = []
-        for _ in range(config.question_count):
-            operation = random.choice(config.operations)
-            questions.append(self._generate_by_operation(operation, config))
-        return questions
+        """Generate a full question set for one session.
+
+        Sets are sampled from a pool cached per configuration (operations,
+        number range, mixed settings): "practice again" with unchanged
+        settings reuses already-generated questions instead of redoing all
+        the generation work.
+        """
+        key = (
+            tuple(config.operations),
+            config.number_min,
+            config.number_max,
+            config.mixed_operator_count,
+            config.enable_parentheses,
+            config.max_parentheses_pairs,
+        )
+        pool = self._question_pool.setdefault(key, [])
+        if len(pool) < config.question_count:
+            pool.extend(
+                self._generate_fresh(config, config.question_count * self._POOL_FACTOR - len(pool))
+            )
+        return self._rand.sample(pool, config.question_count)
+
+    def _generate_fresh(self, config: PracticeConfig, count: int) -> list[PracticeQuestion]:
+        """Generate *count* new questions for *config*.
+
+        Simple operations (add/sub/mul/div) are batched: all operands for
+        one operation are drawn in a couple of `np.random.randint` calls and
+        combined vectorially, leaving only string formatting per question.
+        Mixed expressions — and any rows a batch could not satisfy — fall
+        back to the per-question path.
+        """
+        choice = self._rand.choice
+        operations = [choice(config.operations) for _ in range(count)]
+        questions: list[PracticeQuestion | None] = [None] * len(operations)
+
+        if np is not None:
+            for op in ("add", "sub", "mul", "div"):
+                indices = [i for i, chosen in enumerate(operations) if chosen == op]
+                if len(indices) >= 2:
+                    for i, question in zip(indices, self._generate_batch(op, len(indices), config)):
+                        questions[i] = question
+
+        for i, operation in enumerate(operations):
+            if questions[i] is None:
+                questions[i] = self._generate_by_operation(operation, config)
+        return questions  # type: ignore[return-value]
+
+    @staticmethod
+    def _generate_batch(op: str, count: int, config: PracticeConfig) -> list[PracticeQuestion | None]:
+        """Vectorized operand generation for one simple operation.
+
+        Division rows whose product falls outside the configured range come
+        back as ``None`` and are regenerated individually by the caller.
+        """
+        lo, hi = config.number_min, config.number_max
+        if op == "div":
+            lo_b = max(1, lo)
+            b = np.random.randint(lo_b, max(lo_b, hi) + 1, size=count)
+            max_q = np.maximum(1, hi // b)
+            high_q = np.maximum(max_q, lo_b)
+            q = lo_b + (np.random.random(count) * (high_q - lo_b + 1)).astype(np.int64)
+            q = np.where(max_q >= lo_b, q, 1)
+            a = b * q
+            valid = (a >= lo) & (a <= hi)
+            return [
+                PracticeQuestion(f"{x} / {y}", answer) if ok else None
+                for x, y, answer, ok in zip(a.tolist(), b.tolist(), q.tolist(), valid.tolist())
+            ]
+
+        a = np.random.randint(lo, hi + 1, size=count)
+        b = np.random.randint(lo, hi + 1, size=count)
+        if op == "add":
+            symbol, answers = "+", a + b
+        elif op == "sub":
+            a, b = np.maximum(a, b), np.minimum(a, b)
+            symbol, answers = "-", a - b
+        else:
+            symbol, answers = "*", a * b
+        return [
+            PracticeQuestion(f"{x} {symbol} {y}", answer)
+            for x, y, answer in zip(a.tolist(), b.tolist(), answers.tolist())
+        ]
 
     def _generate_by_operation(self, operation: str, config: PracticeConfig) -> PracticeQuestion:
+        randrange = self._rand.randrange
         if operation == "add":
-            a = random.randint(config.number_min, config.number_max)
-            b = random.randint(config.number_min, config.number_max)
+            a = randrange(config.number_min, config.number_max + 1)
+            b = randrange(config.number_min, config.number_max + 1)
             expression = f"{a} + {b}"
             return PracticeQuestion(expression=expression, correct_answer=a + b)
 
         if operation == "sub":
-            a = random.randint(config.number_min, config.number_max)
-            b = random.randint(config.number_min, config.number_max)
+            a = randrange(config.number_min, config.number_max + 1)
+            b = randrange(config.number_min, config.number_max + 1)
             if a < b:
                 a, b = b, a
             expression = f"{a} - {b}"
             return PracticeQuestion(expression=expression, correct_answer=a - b)
 
         if operation == "mul":
-            a = random.randint(config.number_min, config.number_max)
-            b = random.randint(config.number_min, config.number_max)
+            a = randrange(config.number_min, config.number_max + 1)
+            b = randrange(config.number_min, config.number_max + 1)
             expression = f"{a} * {b}"
             return PracticeQuestion(expression=expression, correct_answer=a * b)
 
@@ -91,10 +245,11 @@ class ProblemGenerator:
 
     def _generate_division(self, num_min: int, num_max: int) -> PracticeQuestion:
         """Generate integer division questions with non-zero divisors."""
+        randrange = self._rand.randrange
         for _ in range(200):
-            b = random.randint(max(1, num_min), max(1, num_max))
+            b = randrange(max(1, num_min), max(1, num_max) + 1)
             max_q = max(1, num_max // b)
-            q = random.randint(max(1, num_min), max_q) if max_q >= max(1, num_min) else 1
+            q = randrange(max(1, num_min), max_q + 1) if max_q >= max(1, num_min) else 1
             a = b * q
             if num_min <= a <= num_max:
                 expression = f"{a} / {b}"
@@ -107,85 +262,108 @@ class ProblemGenerator:
     def _generate_mixed(self, config: PracticeConfig) -> PracticeQuestion:
         """Generate mixed expressions with optional parentheses.
 
-        Constraints:
-        - result must be an integer
-        - result must be non-negative
-        - expression must be valid (no division by zero)
+        Expressions are built constructively — the running value is tracked
+        alongside the string, subtrahends are capped, and divisors are drawn
+        from actual divisors of the current value — so every attempt yields
+        a valid, integer, non-negative result. No rejection sampling.
         """
         op_count = max(2, config.mixed_operator_count)
-        for _ in range(500):
-            expression = self._build_mixed_expression(
-                num_min=config.number_min,
-                num_max=config.number_max,
-                operator_count=op_count,
-                with_parentheses=config.enable_parentheses,
-                max_pairs=config.max_parentheses_pairs,
-            )
-            try:
-                result = self._evaluator.evaluate(expression)
-            except (ZeroDivisionError, ValueError):
-                continue
-
-            if result.denominator != 1:
-                continue
-            value = int(result)
-            if value < 0:
-                continue
-            return PracticeQuestion(expression=expression, correct_answer=value)
-
-        return PracticeQuestion(expression="(8 + 4) * 2", correct_answer=24)
-
-    def _build_mixed_expression(
+        expression, value = self._build_valid_mixed(
+            num_min=config.number_min,
+            num_max=config.number_max,
+            operator_count=op_count,
+            with_parentheses=config.enable_parentheses,
+            max_pairs=config.max_parentheses_pairs,
+        )
+        return PracticeQuestion(expression=expression, correct_answer=value)
+
+    def _build_valid_mixed(
         self,
         num_min: int,
         num_max: int,
         operator_count: int,
         with_parentheses: bool,
         max_pairs: int,
-    ) -> str:
-        """Build expression string from random numbers/operators.
+    ) -> tuple[str, int]:
+        """Build a guaranteed-valid expression and its integer value.
 
-        Parentheses are inserted by wrapping non-overlapping number spans.
+        The expression is a chain of multiplicative segments joined by +/-.
+        Segment tokens are only flushed once the segment's value is known,
+        which lets the joining sign be chosen so the running total never
+        goes negative. Divisions always pick an exact divisor in range.
         """
-        numbers = [str(random.randint(num_min, num_max)) for _ in range(operator_count + 1)]
-        operators = [random.choice(["+", "-", "*", "/"]) for _ in range(operator_count)]
-
-        if with_parentheses and max_pairs > 0 and operator_count >= 2:
-            spans = self._pick_non_overlapping_spans(operator_count + 1, max_pairs)
-            prefix = [""] * (operator_count + 1)
-            suffix = [""] * (operator_count + 1)
-            for start_idx, end_idx in spans:
-                prefix[start_idx] += "("
-                suffix[end_idx] = ")" + suffix[end_idx]
-            for i in range(operator_count + 1):
-                numbers[i] = f"{prefix[i]}{numbers[i]}{suffix[i]}"
-
-        parts: list[str] = [numbers[0]]
-        for i in range(operator_count):
-            parts.append(operators[i])
-            parts.append(numbers[i + 1])
-        return " ".join(parts)
-
-    def _pick_non_overlapping_spans(self, number_count: int, max_pairs: int) -> list[tuple[int, int]]:
-        """Pick random non-overlapping inclusive ranges for parentheses."""
-        span_limit = min(max_pairs, number_count // 2)
-        target = random.randint(1, span_limit)
-        spans: list[tuple[int, int]] = []
-
-        for _ in range(40):
-            if len(spans) >= target:
-                break
-
-            start = random.randint(0, number_count - 2)
-            end = random.randint(start + 1, number_count - 1)
-            candidate = (start, end)
-            if any(self._is_overlap(candidate, existing) for existing in spans):
+        ops_left = operator_count
+        pairs_left = max_pairs if with_parentheses else 0
+        lo_div = max(1, num_min)
+        randrange = self._rand.randrange
+        rand = self._rand.random
+        choose = self._rand.choice
+
+        def plain() -> int:
+            return randrange(num_min, num_max + 1)
+
+        def pick_divisor(value: int) -> int | None:
+            if value == 0:
+                return randrange(lo_div, max(lo_div, num_max) + 1)
+            divisors = [d for d in range(lo_div, num_max + 1) if value % d == 0]
+            return choose(divisors) if divisors else None
+
+        def make_operand() -> tuple[list[str], int]:
+            """A plain number, or sometimes a parenthesized additive chain."""
+            nonlocal ops_left, pairs_left
+            if pairs_left > 0 and ops_left >= 1 and rand() < 0.35:
+                inner_ops = min(ops_left, randrange(1, 3))
+                ops_left -= inner_ops
+                pairs_left -= 1
+                value = plain()
+                parts = [str(value)]
+                for _ in range(inner_ops):
+                    if value >= num_min and rand() < 0.5:
+                        term = randrange(num_min, min(num_max, value) + 1)
+                        parts += ["-", str(term)]
+                        value -= term
+                    else:
+                        term = plain()
+                        parts += ["+", str(term)]
+                        value += term
+                return ["(" + " ".join(parts) + ")"], value
+            value = plain()
+            return [str(value)], value
+
+        output: list[str] = []
+        total = 0
+
+        def flush_segment(tokens: list[str], value: int) -> None:
+            """Append one finished segment, choosing its joining sign now."""
+            nonlocal total
+            if not output:
+                total = value
+            elif value <= total and rand() < 0.5:
+                output.append("-")
+                total -= value
+            else:
+                output.append("+")
+                total += value
+            output.extend(tokens)
+
+        segment, seg_value = make_operand()
+        while ops_left > 0:
+            ops_left -= 1
+            roll = rand()
+            if roll < 0.25:
+                divisor = pick_divisor(seg_value)
+                if divisor is not None:
+                    segment += ["/", str(divisor)]
+                    seg_value = seg_value // divisor if seg_value else 0
+                    continue
+                roll = 0.4  # no divisor in range: multiply instead
+            if roll < 0.5:
+                factor = plain()
+                segment += ["*", str(factor)]
+                seg_value *= factor
                 continue
-            spans.append(candidate)
-
-        spans.sort(key=lambda s: (s[0], s[1]))
-        return spans
+            flush_segment(segment, seg_value)
+            segment, seg_value = make_operand()
+        flush_segment(segment, seg_value)
 
-    @staticmethod
-    def _is_overlap(a: tuple[int, int], b: tuple[int, int]) -> bool:
-        return not (a[1] < b[0] or b[1] < a[0])
+        return " ".join(output), total
@@ -3,10 +3,14 @@ from __future__ import annotations
 """Abstract interface for handwriting / OCR recognition backends."""
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 
-from PyQt5.QtCore import QBuffer, QIODevice
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
 from PyQt5.QtGui import QImage
 
+# Deletion table: every byte except ASCII '0'..'9'.
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
 
 class RecognizerBackend(ABC):
     """Minimal contract: take a canvas snapshot, return an integer or *None*."""
@@ -28,11 +32,45 @@ class RecognizerBackend(ABC):
     def available(self) -> bool:
         """Whether this backend is ready (dependencies loaded, API reachable, etc.)."""
 
+    @property
+    def is_local(self) -> bool:
+        """Whether recognize() runs entirely on this machine.
+
+        Cloud backends leave this False: every recognize() call there is a
+        real (often billed) network request, so callers must not issue
+        throwaway recognitions against them, e.g. to warm lazy models.
+        """
+        return False
+
+    @staticmethod
+    def _digits_to_int(parts: Iterable[str]) -> int | None:
+        """Collect ASCII digits from text fragments.
+
+        Encode-then-translate keeps the whole scan in C — no per-character
+        Python loop; returns ``None`` when no digit is present.
+        """
+        buf = bytearray()
+        for part in parts:
+            buf += part.encode("ascii", "ignore").translate(None, _NON_DIGIT_BYTES)
+        if not buf:
+            return None
+        return int(buf)
+
     @staticmethod
     def _qimage_to_png_bytes(image: QImage) -> bytes | None:
-        """Encode a QImage as PNG bytes (shared helper for cloud backends)."""
-        buf = QBuffer()
+        """Encode a QImage as PNG bytes (shared helper for cloud backends).
+
+        Quality 1 maps to the lowest deflate effort; on a near-binary
+        handwriting canvas it compresses almost as well as the default
+        level at a fraction of the CPU cost. The QByteArray is per call on
+        purpose: recognize() runs on thread-pool workers and overlapping
+        recognitions against the same backend must not share a buffer.
+        """
+        qba = QByteArray()
+        buf = QBuffer(qba)
         buf.open(QIODevice.WriteOnly)
-        if not image.save(buf, "PNG"):
+        saved = image.save(buf, "PNG", 1)
+        buf.close()
+        if not saved:
             return None
-        return bytes(buf.data())
+        return bytes(qba)
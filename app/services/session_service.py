@@ -31,6 +31,7 @@ class SessionService:
         self._config: PracticeConfig | None = None
         self._questions: list[PracticeQuestion] = []
         self._records: list[AnswerRecord] = []
+        self._correct_count = 0
         self._current_index = 0
         self._start_time = 0.0
 
@@ -39,6 +40,7 @@ class SessionService:
         self._config = config
         self._questions = self._generator.generate_questions(config)
         self._records = []
+        self._correct_count = 0
         self._current_index = 0
         self._start_time = monotonic()
 
@@ -60,7 +62,9 @@ class SessionService:
 
     @property
     def correct_count(self) -> int:
-        return sum(1 for item in self._records if item.is_correct)
+        # Maintained incrementally in submit_answer; the UI reads this after
+        # every submission, so avoid rescanning the records each time.
+        return self._correct_count
 
     def elapsed_seconds(self) -> int:
         """Elapsed wall-clock seconds since `start`."""
@@ -80,12 +84,18 @@ class SessionService:
             raise RuntimeError("session not started")
         if self._current_index >= len(self._questions):
             raise RuntimeError("session already complete")
-        if not answer_text.strip():
+        stripped = answer_text.strip()
+        if not stripped:
             raise ValueError("empty_answer")
+        # Validate before int(): OCR noise hits this often, and a failed
+        # isdigit check is far cheaper than raising through int().
+        if not stripped.lstrip("-").isdigit() or stripped.startswith("--"):
+            raise ValueError("bad_answer")
 
-        user_answer = int(answer_text.strip())
+        user_answer = int(stripped)
         question = self._questions[self._current_index]
         is_correct = user_answer == question.correct_answer
+        self._correct_count += is_correct
         self._records.append(
             AnswerRecord(
                 question=question.expression,
@@ -130,6 +140,7 @@ class SessionService:
         # Keep config for "practice again", clear active question state.
         self._questions = []
         self._records = []
+        self._correct_count = 0
         self._current_index = 0
         self._start_time = 0.0
         return result
@@ -7,14 +7,11 @@ import hashlib
 import hmac
 import json
 import logging
-import re
 import time
-import urllib.error
-import urllib.request
-from datetime import datetime, timezone
 
 from PyQt5.QtGui import QImage
 
+from app.services import http_client
 from app.services.recognizer_backend import RecognizerBackend
 
 log = logging.getLogger(__name__)
@@ -25,6 +22,11 @@ _ACTION = "GeneralHandwritingOCR"
 _VERSION = "2018-11-19"
 _TIMEOUT = 10
 
+# Request-invariant pieces of the TC3 canonical request.
+_CT = "application/json; charset=utf-8"
+_CANONICAL_HEADERS = f"content-type:{_CT}\nhost:{_HOST}\n"
+_SIGNED_HEADERS = "content-type;host"
+
 
 class TencentOcrRecognizer(RecognizerBackend):
     """Recognise handwritten integers via the Tencent Cloud OCR API."""
@@ -32,24 +34,23 @@ class TencentOcrRecognizer(RecognizerBackend):
     def __init__(self, secret_id: str, secret_key: str) -> None:
         self._secret_id = secret_id
         self._secret_key = secret_key
+        self._secret_tc3 = ("TC3" + secret_key).encode("utf-8")
+        # Derived signing key, valid for one UTC date: (date, key).
+        self._signing_key_cache: tuple[str, bytes] | None = None
 
     def recognize(self, image: QImage) -> int | None:
         png = self._qimage_to_png_bytes(image)
         if not png:
             return None
         b64 = base64.b64encode(png).decode("ascii")
-        payload = json.dumps({"ImageBase64": b64})
+        payload = json.dumps({"ImageBase64": b64}).encode("utf-8")
         headers = self._build_signed_headers(payload)
         try:
-            req = urllib.request.Request(
-                f"https://{_HOST}",
-                data=payload.encode("utf-8"),
-                headers=headers,
-                method="POST",
+            body = http_client.post(
+                f"https://{_HOST}", data=payload, headers=headers, timeout=_TIMEOUT
             )
-            with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
-                result: dict = json.loads(resp.read().decode("utf-8"))
-        except (urllib.error.URLError, OSError, json.JSONDecodeError) as exc:
+            result: dict = json.loads(body.decode("utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
             log.warning("Tencent OCR request failed: %s", exc)
             return None
         return self._extract_integer(result)
@@ -64,16 +65,15 @@ class TencentOcrRecognizer(RecognizerBackend):
 
     # -- TC3-HMAC-SHA256 signing -------------------------------------------
 
-    def _build_signed_headers(self, payload: str) -> dict[str, str]:
+    def _build_signed_headers(self, payload: bytes) -> dict[str, str]:
         timestamp = int(time.time())
-        date = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+        # time.strftime on a struct_time is markedly cheaper than building
+        # a datetime just to format it.
+        date = time.strftime("%Y-%m-%d", time.gmtime(timestamp))
 
-        ct = "application/json; charset=utf-8"
-        canonical_headers = f"content-type:{ct}\nhost:{_HOST}\n"
-        signed_headers = "content-type;host"
-        payload_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        payload_hash = hashlib.sha256(payload).hexdigest()
         canonical_request = (
-            f"POST\n/\n\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
+            f"POST\n/\n\n{_CANONICAL_HEADERS}\n{_SIGNED_HEADERS}\n{payload_hash}"
         )
 
         credential_scope = f"{date}/{_SERVICE}/tc3_request"
@@ -82,44 +82,53 @@ class TencentOcrRecognizer(RecognizerBackend):
             + hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()
         )
 
-        def _hmac(key: bytes, msg: str) -> bytes:
-            return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
-
-        secret_date = _hmac(("TC3" + self._secret_key).encode("utf-8"), date)
-        secret_service = _hmac(secret_date, _SERVICE)
-        secret_signing = _hmac(secret_service, "tc3_request")
-        signature = hmac.new(
-            secret_signing, string_to_sign.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        secret_signing = self._derive_signing_key(date)
+        signature = hmac.digest(
+            secret_signing, string_to_sign.encode("utf-8"), "sha256"
+        ).hex()
 
         authorization = (
             f"TC3-HMAC-SHA256 Credential={self._secret_id}/{credential_scope}, "
-            f"SignedHeaders={signed_headers}, Signature={signature}"
+            f"SignedHeaders={_SIGNED_HEADERS}, Signature={signature}"
         )
         return {
             "Authorization": authorization,
-            "Content-Type": ct,
+            "Content-Type": _CT,
             "Host": _HOST,
             "X-TC-Action": _ACTION,
             "X-TC-Timestamp": str(timestamp),
             "X-TC-Version": _VERSION,
         }
 
+    def _derive_signing_key(self, date: str) -> bytes:
+        """Return the TC3 signing key for `date`, deriving it once per day.
+
+        The three-step HMAC chain depends only on the secret and the UTC
+        date, so consecutive requests within a day reuse the cached key.
+        """
+        cached = self._signing_key_cache
+        if cached is not None and cached[0] == date:
+            return cached[1]
+
+        def _hmac(key: bytes, msg: str) -> bytes:
+            # hmac.digest() takes the openssl fast path for named digests,
+            # skipping the HMAC object setup hmac.new() pays per call.
+            return hmac.digest(key, msg.encode("utf-8"), "sha256")
+
+        secret_date = _hmac(self._secret_tc3, date)
+        secret_service = _hmac(secret_date, _SERVICE)
+        secret_signing = _hmac(secret_service, "tc3_request")
+        self._signing_key_cache = (date, secret_signing)
+        return secret_signing
+
     # -- Response parsing ---------------------------------------------------
 
-    @staticmethod
-    def _extract_integer(result: dict) -> int | None:
+    @classmethod
+    def _extract_integer(cls, result: dict) -> int | None:
         try:
             items = result["Response"]["TextDetections"]
             if not items:
                 return None
-            raw = " ".join(item.get("DetectedText", "") for item in items)
         except (KeyError, TypeError):
             return None
-        digits = re.sub(r"\D", "", raw)
-        if not digits:
-            return None
-        try:
-            return int(digits)
-        except ValueError:
-            return None
+        return cls._digits_to_int(item.get("DetectedText", "") for item in items)
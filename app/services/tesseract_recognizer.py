@@ -2,9 +2,7 @@ from __future__ import annotations
 
 """Tesseract OCR backend (local, requires Tesseract binary + pytesseract)."""
 
-import io
 import logging
-import re
 
 from PyQt5.QtGui import QImage
 
@@ -23,14 +21,17 @@ except ImportError:  # pragma: no cover
 class TesseractRecognizer(RecognizerBackend):
     """Offline digit recognizer backed by Tesseract OCR."""
 
+    def __init__(self) -> None:
+        # Result of the version-probe subprocess; None until first checked.
+        self._available: bool | None = None
+
     def recognize(self, image: QImage) -> int | None:
         if not self.available:
             return None
-        png = self._qimage_to_png_bytes(image)
-        if not png:
+        pil = self._qimage_to_pil(image)
+        if pil is None:
             return None
         try:
-            pil = PILImage.open(io.BytesIO(png))
             text: str = pytesseract.image_to_string(
                 pil,
                 config="--psm 7 -c tessedit_char_whitelist=0123456789",
@@ -38,24 +39,48 @@ class TesseractRecognizer(RecognizerBackend):
         except Exception as exc:  # noqa: BLE001
             log.warning("Tesseract recognition failed: %s", exc)
             return None
-        digits = re.sub(r"\D", "", text)
-        if not digits:
+        return self._digits_to_int((text,))
+
+    @staticmethod
+    def _qimage_to_pil(image: QImage):
+        """Wrap the QImage pixel buffer in a PIL image without encoding.
+
+        Tesseract runs locally, so there is no reason to deflate the canvas
+        to PNG and have PIL inflate it right back; one grayscale buffer copy
+        replaces the encode/decode round-trip.
+        """
+        gray = image.convertToFormat(QImage.Format_Grayscale8)
+        w, h = gray.width(), gray.height()
+        if w <= 0 or h <= 0:
             return None
-        try:
-            return int(digits)
-        except ValueError:
+        ptr = gray.bits()
+        if ptr is None:
             return None
+        try:
+            buf_size = gray.sizeInBytes()
+        except AttributeError:
+            buf_size = gray.byteCount()
+        ptr.setsize(buf_size)
+        return PILImage.frombuffer("L", (w, h), bytes(ptr), "raw", "L", gray.bytesPerLine(), 1)
 
     @property
     def name(self) -> str:
         return "tesseract"
 
+    @property
+    def is_local(self) -> bool:
+        return True
+
     @property
     def available(self) -> bool:
         if pytesseract is None or PILImage is None:
             return False
-        try:
-            pytesseract.get_tesseract_version()
-            return True
-        except Exception:  # noqa: BLE001
-            return False
+        if self._available is None:
+            # get_tesseract_version() spawns a subprocess; probe once and
+            # remember the outcome instead of paying it on every access.
+            try:
+                pytesseract.get_tesseract_version()
+                self._available = True
+            except Exception:  # noqa: BLE001
+                self._available = False
+        return self._available
@@ -7,7 +7,7 @@ import os
 from pathlib import Path
 import sys
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QMutex, QMutexLocker, QRunnable, Qt, QThreadPool
 from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QStackedWidget
 from qt_material import apply_stylesheet
 
@@ -31,6 +31,30 @@ _TENCENT_SECRET_ID = os.environ.get("TENCENT_SECRET_ID", "")
 _TENCENT_SECRET_KEY = os.environ.get("TENCENT_SECRET_KEY", "")
 
 
+class _RecognizerWarmupTask(QRunnable):
+    """Build a recognizer and probe its availability off the UI thread.
+
+    Some backends do expensive one-time setup on first use — Tesseract's
+    `available` spawns a version-probe subprocess, the sklearn backend may
+    train a model — and doing that lazily stalls the first question.
+    """
+
+    def __init__(self, window: MainWindow, key: str) -> None:
+        super().__init__()
+        self._window = window
+        self._key = key
+
+    def run(self) -> None:
+        try:
+            recognizer = MainWindow._build_recognizer(self._key)
+            recognizer.available  # noqa: B018 - primes the availability probe
+        except Exception:  # noqa: BLE001
+            log.exception("Recognizer warm-up failed for %s", self._key)
+            return
+        with QMutexLocker(self._window._recognizer_lock):
+            self._window._recognizer_cache.setdefault(self._key, recognizer)
+
+
 class MainWindow(QMainWindow):
     """Top-level window that wires dependencies and UI navigation."""
 
@@ -41,6 +65,7 @@ class MainWindow(QMainWindow):
         self.resize(1200, 900)
 
         self._recognizer_cache: dict[str, RecognizerBackend] = {}
+        self._recognizer_lock = QMutex()
 
         session_service = SessionService(generator=ProblemGenerator())
         history_repo = HistoryRepository()
@@ -65,14 +90,26 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentWidget(self.setup_page)
 
         self._bind_signals()
+        self._warm_recognizer(self.setup_page.selected_recognizer_key())
 
     # -- Recognizer factory -------------------------------------------------
 
     def _get_recognizer(self, key: str) -> RecognizerBackend:
         """Return a (cached) recognizer for *key*, creating it on first use."""
-        if key not in self._recognizer_cache:
-            self._recognizer_cache[key] = self._build_recognizer(key)
-        return self._recognizer_cache[key]
+        with QMutexLocker(self._recognizer_lock):
+            recognizer = self._recognizer_cache.get(key)
+        if recognizer is None:
+            recognizer = self._build_recognizer(key)
+            with QMutexLocker(self._recognizer_lock):
+                recognizer = self._recognizer_cache.setdefault(key, recognizer)
+        return recognizer
+
+    def _warm_recognizer(self, key: str) -> None:
+        """Start building *key*'s backend in the background, if not cached yet."""
+        with QMutexLocker(self._recognizer_lock):
+            if key in self._recognizer_cache:
+                return
+        QThreadPool.globalInstance().start(_RecognizerWarmupTask(self, key))
 
     @staticmethod
     def _build_recognizer(key: str) -> RecognizerBackend:
@@ -107,6 +144,9 @@ class MainWindow(QMainWindow):
         self.setup_page.start_requested.connect(self._on_start_practice)
         self.setup_page.history_requested.connect(self._show_history_page)
         self.setup_page.locale_changed_requested.connect(self.localizer.set_locale)
+        self.setup_page.ocr_combo.currentIndexChanged.connect(
+            lambda _: self._warm_recognizer(self.setup_page.selected_recognizer_key())
+        )
 
         self.practice_page.submit_requested.connect(self.controller.submit_answer)
         self.practice_page.next_requested.connect(self.controller.next_question)
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QBrush, QColor
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import count
+
+from PyQt5.QtCore import QEvent, QModelIndex, QRect, Qt, QAbstractTableModel, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
+    QApplication,
     QDialog,
     QFrame,
     QGridLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QPushButton,
     QStyle,
     QStyledItemDelegate,
+    QStyleOptionButton,
     QStyleOptionViewItem,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -33,39 +39,343 @@ _DETAIL_CORRECT_FG = QColor("#166534")
 _DETAIL_WRONG_BG = QColor("#fed7d7")
 _DETAIL_WRONG_FG = QColor("#991b1b")
 
+# 详情弹窗样式表：常量化，Qt 的样式缓存可跨弹窗复用解析结果
+_DETAIL_DIALOG_STYLESHEET = (
+    "QDialog { background: palette(window); } "
+    "QFrame#detailHeader { "
+    "  background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #f0f9ff, stop:1 #e0f2fe); "
+    "  border: 1px solid #bae6fd; border-radius: 10px; "
+    "  padding: 12px; "
+    "} "
+    "QLabel[class=\"detailStat\"] { font-size: 13pt; font-weight: 600; color: #0c4a6e; } "
+    "QLabel[class=\"detailStatValue\"] { font-size: 14pt; font-weight: 700; color: #0369a1; } "
+    "QTableView { gridline-color: #e2e8f0; border-radius: 6px; } "
+    "QTableView::item { padding: 6px; } "
+)
+
+# QBrush 单例：避免在逐行/逐格循环里重复构造 QBrush
+_BRUSH_HIGH = (QBrush(_HISTORY_ACCURACY_HIGH_BG), QBrush(_HISTORY_ACCURACY_HIGH_FG))
+_BRUSH_MID = (QBrush(_HISTORY_ACCURACY_MID_BG), QBrush(_HISTORY_ACCURACY_MID_FG))
+_BRUSH_LOW = (QBrush(_HISTORY_ACCURACY_LOW_BG), QBrush(_HISTORY_ACCURACY_LOW_FG))
+_DETAIL_CORRECT_BRUSHES = (QBrush(_DETAIL_CORRECT_BG), QBrush(_DETAIL_CORRECT_FG))
+_DETAIL_WRONG_BRUSHES = (QBrush(_DETAIL_WRONG_BG), QBrush(_DETAIL_WRONG_FG))
+
 from app.domain.models import SessionResult
 from app.i18n.localizer import Localizer
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# 正确率分桶（低/中/高），与 _accuracy_brushes 的阈值一致
+_BUCKET_BRUSHES = (_BRUSH_LOW, _BRUSH_MID, _BRUSH_HIGH)
+_BUCKET_EDGES = np.array([60.0, 80.0], dtype=np.float32) if np is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(total_seconds: int) -> str:
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+# Synthetic role bundling the three paint roles into one data() call.
+_MULTI_ROLE = Qt.UserRole + 7
+
 
 class _ColoredItemDelegate(QStyledItemDelegate):
     """Manually paints per-item BackgroundRole / ForegroundRole colors,
-    bypassing qt_material's application-level stylesheet overrides."""
+    bypassing qt_material's application-level stylesheet overrides.
+
+    Paint roles are fetched with a single `_MULTI_ROLE` data() call when
+    the model supports it (one Python↔C++ transition instead of three)
+    and memoized per (row, column); hook `clear_cache` to `modelReset`.
+    """
+
+    _CACHE_MAX = 256
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._bundle_cache: OrderedDict[tuple[int, int], tuple] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        self._bundle_cache.clear()
+
+    def _paint_roles(self, index) -> tuple:
+        key = (index.row(), index.column())
+        cache = self._bundle_cache
+        bundle = cache.get(key)
+        if bundle is None:
+            bundle = index.data(_MULTI_ROLE)
+            if bundle is None:  # models without _MULTI_ROLE (detail table)
+                bundle = (
+                    index.data(Qt.DisplayRole),
+                    index.data(Qt.BackgroundRole),
+                    index.data(Qt.ForegroundRole),
+                )
+            cache[key] = bundle
+            if len(cache) > self._CACHE_MAX:
+                cache.popitem(last=False)
+        return bundle
 
     def paint(self, painter, option, index):
+        # Both models (HistoryModel and DetailModel) guarantee paint roles
+        # are QBrush or None, so a None check replaces isinstance here.
+        text, bg, fg = self._paint_roles(index)
         painter.save()
         if option.state & QStyle.State_Selected:
             painter.fillRect(option.rect, option.palette.highlight())
-        else:
-            bg = index.data(Qt.BackgroundRole)
-            if isinstance(bg, QBrush) and bg.style() != Qt.NoBrush:
-                painter.fillRect(option.rect, bg)
+        elif bg is not None and bg.style() != Qt.NoBrush:
+            painter.fillRect(option.rect, bg)
 
-        text = index.data(Qt.DisplayRole)
         if text is not None:
             if option.state & QStyle.State_Selected:
                 painter.setPen(option.palette.highlightedText().color())
+            elif fg is not None:
+                painter.setPen(fg.color())
             else:
-                fg = index.data(Qt.ForegroundRole)
-                if isinstance(fg, QBrush):
-                    painter.setPen(fg.color())
-                else:
-                    painter.setPen(option.palette.text().color())
+                painter.setPen(option.palette.text().color())
             text_rect = option.rect.adjusted(6, 0, -6, 0)
             painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, str(text))
 
         painter.restore()
 
 
+# Distinguishes QPixmapCache keys across detail dialogs.
+_detail_dialog_seq = count()
+
+
+class _PixmapCachedDelegate(_ColoredItemDelegate):
+    """Delegate for the static detail table that blits cached pixmaps.
+
+    Detail rows never change once the dialog is open, so each cell is
+    rendered once into a `QPixmapCache` entry; scrolling then costs a
+    raster blit instead of a text layout per cell. The cell size is part
+    of the cache key, so column resizes miss naturally.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._key_prefix = ""
+        self.begin_dialog()
+
+    def begin_dialog(self) -> None:
+        """Switch to a fresh cache namespace for a new dialog's contents."""
+        self._key_prefix = f"hist_detail_{next(_detail_dialog_seq)}"
+        self.clear_cache()
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.State_Selected:
+            super().paint(painter, option, index)
+            return
+        rect = option.rect
+        key = f"{self._key_prefix}:{index.row()}:{index.column()}:{rect.width()}x{rect.height()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            ratio = painter.device().devicePixelRatioF()
+            pixmap = QPixmap(int(rect.width() * ratio), int(rect.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            cell_painter = QPainter(pixmap)
+            cell_option = QStyleOptionViewItem(option)
+            cell_option.rect = QRect(0, 0, rect.width(), rect.height())
+            super().paint(cell_painter, cell_option, index)
+            cell_painter.end()
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+
+class HistoryModel(QAbstractTableModel):
+    """Read-only table model over the loaded `SessionResult` list.
+
+    Qt only calls `data()` for visible cells, so populating the history
+    view is one model reset regardless of row count — no per-row item or
+    widget allocation. Invariant relied on by the delegate: Background/
+    ForegroundRole always return a `QBrush`, never another type.
+    """
+
+    COLUMN_COUNT = 6
+    DETAILS_COLUMN = 5
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._sessions: list[SessionResult] = []
+        self._headers: list[str] = [""] * self.COLUMN_COUNT
+        self._details_text = ""
+        self._cols: list[list[str]] = [[] for _ in range(5)]
+        self._acc: list[float] = []
+        self._bg: list[QBrush] = []
+        self._fg: list[QBrush] = []
+
+    @property
+    def accuracies(self) -> list[float]:
+        """Per-session accuracies, cached at reset for summary statistics."""
+        return self._acc
+
+    def reset(self, sessions: list[SessionResult], details_text: str) -> None:
+        """Swap in a new session list with a single model reset."""
+        self.beginResetModel()
+        self._sessions = sessions
+        self._details_text = details_text
+        self._rebuild_cache()
+        self.endResetModel()
+
+    def _rebuild_cache(self) -> None:
+        """Precompute display strings and brushes, column-wise.
+
+        `data()` is the paint hot path; with these parallel lists every
+        role request is a plain list index instead of attribute lookups
+        plus f-string formatting per repaint.
+        """
+        sessions = self._sessions
+        self._acc = [s.accuracy for s in sessions]
+        self._cols = [
+            [s.timestamp for s in sessions],
+            [s.username for s in sessions],
+            [f"{s.score} / {s.total}" for s in sessions],
+            [f"{s.accuracy:.2f}%" for s in sessions],
+            [_format_seconds(s.elapsed_seconds) for s in sessions],
+        ]
+        self._bg = []
+        self._fg = []
+        if np is not None and sessions:
+            # 一次 digitize 完成所有行的分桶，替代逐行 Python 分支
+            accs = np.fromiter(self._acc, dtype=np.float32, count=len(sessions))
+            for bucket in np.digitize(accs, _BUCKET_EDGES).tolist():
+                bg, fg = _BUCKET_BRUSHES[bucket]
+                self._bg.append(bg)
+                self._fg.append(fg)
+        else:
+            for s in sessions:
+                bg, fg = _accuracy_brushes(s.accuracy)
+                self._bg.append(bg)
+                self._fg.append(fg)
+
+    def set_headers(self, headers: list[str]) -> None:
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    # -- QAbstractTableModel interface --------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._sessions)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # noqa: N802 - Qt API
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if role == Qt.DisplayRole:
+            col = index.column()
+            if col == self.DETAILS_COLUMN:
+                return self._details_text
+            return self._cols[col][row]
+        if role == Qt.BackgroundRole:
+            return self._bg[row]
+        if role == Qt.ForegroundRole:
+            return self._fg[row]
+        if role == _MULTI_ROLE:
+            col = index.column()
+            text = self._details_text if col == self.DETAILS_COLUMN else self._cols[col][row]
+            return (text, self._bg[row], self._fg[row])
+        return None
+
+
+def _accuracy_brushes(accuracy: float) -> tuple[QBrush, QBrush]:
+    """历史记录行着色：≥80% 绿，≥60% 黄，<60% 红（返回共享 QBrush 单例）。"""
+    if accuracy >= 80:
+        return _BRUSH_HIGH
+    if accuracy >= 60:
+        return _BRUSH_MID
+    return _BRUSH_LOW
+
+
+class DetailModel(QAbstractTableModel):
+    """Read-only model over one session's answer records.
+
+    Virtualizes the detail dialog: only visible rows hit `data()`, so the
+    dialog opens instantly regardless of how many questions the session
+    had. Holds the same QBrush-or-None invariant as `HistoryModel`.
+    """
+
+    COLUMN_COUNT = 4
+
+    def __init__(self, details, status_texts: tuple[str, str], headers: list[str], parent=None) -> None:
+        super().__init__(parent)
+        self._details = details
+        self._status_texts = status_texts
+        self._headers = headers
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._details)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # noqa: N802 - Qt API
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def _display(self, item, col: int) -> str:
+        if col == 0:
+            return item.question
+        if col == 1:
+            return str(item.user_answer)
+        if col == 2:
+            return str(item.correct_answer)
+        return self._status_texts[int(item.is_correct)]
+
+    def data(self, index, role=Qt.DisplayRole):
+        item = self._details[index.row()]
+        if role == Qt.DisplayRole:
+            return self._display(item, index.column())
+        if role == Qt.BackgroundRole:
+            return (_DETAIL_CORRECT_BRUSHES if item.is_correct else _DETAIL_WRONG_BRUSHES)[0]
+        if role == Qt.ForegroundRole:
+            return (_DETAIL_CORRECT_BRUSHES if item.is_correct else _DETAIL_WRONG_BRUSHES)[1]
+        if role == _MULTI_ROLE:
+            bg, fg = _DETAIL_CORRECT_BRUSHES if item.is_correct else _DETAIL_WRONG_BRUSHES
+            return (self._display(item, index.column()), bg, fg)
+        return None
+
+
+class _DetailButtonDelegate(_ColoredItemDelegate):
+    """History-table delegate that paints the details column as a button.
+
+    One painted QStyleOptionButton per visible cell replaces the old
+    per-row QPushButton widgets (each a full QObject with style tree and
+    signal connections); clicks are detected in `editorEvent`.
+    """
+
+    details_requested = pyqtSignal(int)
+
+    def paint(self, painter, option, index):
+        if index.column() != HistoryModel.DETAILS_COLUMN:
+            super().paint(painter, option, index)
+            return
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 4, -4, -4)
+        button.text = str(index.data(Qt.DisplayRole) or "")
+        button.state = QStyle.State_Enabled
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index):  # noqa: N802 - Qt API
+        if (
+            index.column() == HistoryModel.DETAILS_COLUMN
+            and event.type() == QEvent.MouseButtonRelease
+            and option.rect.contains(event.pos())
+        ):
+            self.details_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class HistoryPage(QWidget):
     back_to_menu_requested = pyqtSignal()
     search_requested = pyqtSignal(str)
@@ -75,8 +385,13 @@ class HistoryPage(QWidget):
         self._localizer = localizer
         self._sessions: list[SessionResult] = []
         self._current_filter = ""
+        self._needs_refresh = False
+        # Memoized translation lookup for repeated dialog opens; flushed on
+        # locale change.
+        self._tr = lru_cache(maxsize=128)(localizer.tr)
         self._build_ui()
         self.retranslate_ui()
+        self._localizer.locale_changed.connect(self._tr.cache_clear)
         self._localizer.locale_changed.connect(self.retranslate_ui)
 
     def _build_ui(self) -> None:
@@ -99,11 +414,28 @@ class HistoryPage(QWidget):
         filter_row.addWidget(self.back_button)
         root.addLayout(filter_row)
 
-        self.table = QTableWidget(0, 6)
-        self.table.setItemDelegate(_ColoredItemDelegate(self.table))
+        self._model = HistoryModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
+        delegate = _DetailButtonDelegate(self.table)
+        self.table.setItemDelegate(delegate)
+        self._model.modelReset.connect(delegate.clear_cache)
+        delegate.details_requested.connect(self._show_details)
+        # 详情弹窗共用一个代理实例，免去每次打开都新建 QObject
+        self._detail_delegate = _PixmapCachedDelegate(self)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        # 统一行高/固定列宽：避免视图按内容逐行测量（O(所有行) 布局）
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(32)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)  # 姓名列自适应
+        self.table.setColumnWidth(0, 170)
+        self.table.setColumnWidth(2, 90)
+        self.table.setColumnWidth(3, 90)
+        self.table.setColumnWidth(4, 80)
         root.addWidget(self.table)
 
         self.summary_label = QLabel("")
@@ -113,6 +445,7 @@ class HistoryPage(QWidget):
         self.search_button.clicked.connect(self._emit_search)
         self.filter_edit.returnPressed.connect(self._emit_search)
         self.back_button.clicked.connect(self.back_to_menu_requested.emit)
+        self.table.doubleClicked.connect(lambda index: self._show_details(index.row()))
 
     def retranslate_ui(self) -> None:
         tr = self._localizer.tr
@@ -120,7 +453,7 @@ class HistoryPage(QWidget):
         self.filter_edit.setPlaceholderText(tr("history_filter_placeholder"))
         self.search_button.setText(tr("btn_search"))
         self.back_button.setText(tr("btn_back_menu"))
-        self.table.setHorizontalHeaderLabels(
+        self._model.set_headers(
             [
                 tr("table_date"),
                 tr("table_name"),
@@ -130,36 +463,39 @@ class HistoryPage(QWidget):
                 tr("table_details"),
             ]
         )
-        self.set_history(self._sessions, self._current_filter)
+        # 表格重建只在页面可见时立即执行；隐藏时推迟到下次 showEvent
+        if self.isVisible():
+            self.set_history(self._sessions, self._current_filter)
+        else:
+            self._needs_refresh = True
+
+    def showEvent(self, event) -> None:  # noqa: N802 - Qt API
+        super().showEvent(event)
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self.set_history(self._sessions, self._current_filter)
 
     def set_history(self, sessions: list[SessionResult], name_filter: str) -> None:
         tr = self._localizer.tr
         self._sessions = sessions
         self._current_filter = name_filter
-        self.table.setRowCount(len(sessions))
-        for row, item in enumerate(sessions):
-            # 历史记录行着色：按正确率整行着色（≥80% 绿 / ≥60% 黄 / <60% 红）
-            score_text = f"{item.score} / {item.total}"
-            values = [
-                item.timestamp,
-                item.username,
-                score_text,
-                f"{item.accuracy:.2f}%",
-                self._format_seconds(item.elapsed_seconds),
-            ]
-            bg, fg = self._accuracy_colors(item.accuracy)
-            for col, value in enumerate(values):
-                cell = QTableWidgetItem(value)
-                cell.setBackground(QBrush(bg))
-                cell.setForeground(QBrush(fg))
-                self.table.setItem(row, col, cell)
-
-            detail_button = QPushButton(tr("btn_view"))
-            detail_button.clicked.connect(lambda _, idx=row: self._show_details(idx))
-            self.table.setCellWidget(row, 5, detail_button)
+        self._needs_refresh = False
+        # 重建期间屏蔽重绘与选中信号，完成后统一刷新一次
+        self.table.setUpdatesEnabled(False)
+        selection = self.table.selectionModel()
+        if selection is not None:
+            selection.blockSignals(True)
+        try:
+            self._model.reset(sessions, tr("btn_view"))
+        finally:
+            if selection is not None:
+                selection.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
         if sessions:
-            avg = sum(item.accuracy for item in sessions) / len(sessions)
+            # 正确率数组在模型重建缓存时已生成，这里只做一次 C 级求和
+            avg = sum(self._model.accuracies) / len(sessions)
             name_title = name_filter if name_filter else tr("history_summary_all")
             self.summary_label.setText(
                 tr("history_summary_stats", name=name_title, count=len(sessions), accuracy=avg)
@@ -174,23 +510,12 @@ class HistoryPage(QWidget):
         if row < 0 or row >= len(self._sessions):
             return
         session = self._sessions[row]
-        tr = self._localizer.tr
+        tr = self._tr
 
         dialog = QDialog(self)
         dialog.setWindowTitle(tr("detail_window_title", username=session.username))
         dialog.resize(720, 520)
-        dialog.setStyleSheet(
-            "QDialog { background: palette(window); } "
-            "QFrame#detailHeader { "
-            "  background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #f0f9ff, stop:1 #e0f2fe); "
-            "  border: 1px solid #bae6fd; border-radius: 10px; "
-            "  padding: 12px; "
-            "} "
-            "QLabel[class=\"detailStat\"] { font-size: 13pt; font-weight: 600; color: #0c4a6e; } "
-            "QLabel[class=\"detailStatValue\"] { font-size: 14pt; font-weight: 700; color: #0369a1; } "
-            "QTableWidget { gridline-color: #e2e8f0; border-radius: 6px; } "
-            "QTableWidget::item { padding: 6px; } "
-        )
+        dialog.setStyleSheet(_DETAIL_DIALOG_STYLESHEET)
 
         layout = QVBoxLayout(dialog)
         layout.setSpacing(16)
@@ -206,41 +531,36 @@ class HistoryPage(QWidget):
         header_layout.addWidget(self._detail_stat_label(tr("table_accuracy")), 2, 0)
         header_layout.addWidget(self._detail_value_label(f"{session.accuracy:.2f}%"), 2, 1)
         header_layout.addWidget(self._detail_stat_label(tr("table_time")), 3, 0)
-        header_layout.addWidget(self._detail_value_label(self._format_seconds(session.elapsed_seconds)), 3, 1)
+        header_layout.addWidget(self._detail_value_label(_format_seconds(session.elapsed_seconds)), 3, 1)
         layout.addWidget(header)
 
-        table = QTableWidget(0, 4)
-        table.setItemDelegate(_ColoredItemDelegate(table))
-        table.setHorizontalHeaderLabels([
-            tr("table_question"),
-            tr("table_your_answer"),
-            tr("table_correct_answer"),
-            tr("table_result"),
-        ])
-        table.horizontalHeader().setStretchLastSection(True)
-        table.verticalHeader().setVisible(False)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setAlternatingRowColors(False)
-
-        if session.details:
-            table.setRowCount(len(session.details))
-            for r, item in enumerate(session.details):
-                # 历史详情逐题着色：对=绿，错=红
-                status = tr("status_correct") if item.is_correct else tr("status_wrong")
-                bg = QBrush(_DETAIL_CORRECT_BG if item.is_correct else _DETAIL_WRONG_BG)
-                fg = QBrush(_DETAIL_CORRECT_FG if item.is_correct else _DETAIL_WRONG_FG)
-                for c, value in enumerate([item.question, str(item.user_answer), str(item.correct_answer), status]):
-                    cell = QTableWidgetItem(value)
-                    cell.setBackground(bg)
-                    cell.setForeground(fg)
-                    table.setItem(r, c, cell)
+        details = session.details
+        if details:
+            # 虚拟化明细表：模型直接包住答题记录，仅可见行调用 data()
+            table = QTableView()
+            status_texts = (tr("status_wrong"), tr("status_correct"))
+            headers = [
+                tr("table_question"),
+                tr("table_your_answer"),
+                tr("table_correct_answer"),
+                tr("table_result"),
+            ]
+            table.setModel(DetailModel(details, status_texts, headers, table))
+            self._detail_delegate.begin_dialog()
+            table.setItemDelegate(self._detail_delegate)
+            table.horizontalHeader().setStretchLastSection(True)
+            table.verticalHeader().setVisible(False)
+            table.setEditTriggers(QTableView.NoEditTriggers)
+            table.setAlternatingRowColors(False)
+            table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            table.verticalHeader().setDefaultSectionSize(32)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+            table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)  # 题目列自适应
+            layout.addWidget(table)
         else:
-            table.setRowCount(1)
-            cell = QTableWidgetItem(tr("detail_none"))
-            table.setItem(0, 0, cell)
-            table.setSpan(0, 0, 1, 4)
-
-        layout.addWidget(table)
+            empty_label = QLabel(tr("detail_none"))
+            empty_label.setAlignment(Qt.AlignCenter)
+            layout.addWidget(empty_label, stretch=1)
 
         close_btn = QPushButton(tr("btn_close"))
         close_btn.setMinimumHeight(40)
@@ -257,17 +577,3 @@ class HistoryPage(QWidget):
         label = QLabel(text)
         label.setProperty("class", "detailStatValue")
         return label
-
-    @staticmethod
-    def _accuracy_colors(accuracy: float) -> tuple[QColor, QColor]:
-        """历史记录行着色：≥80% 绿，≥60% 黄，<60% 红。"""
-        if accuracy >= 80:
-            return _HISTORY_ACCURACY_HIGH_BG, _HISTORY_ACCURACY_HIGH_FG
-        if accuracy >= 60:
-            return _HISTORY_ACCURACY_MID_BG, _HISTORY_ACCURACY_MID_FG
-        return _HISTORY_ACCURACY_LOW_BG, _HISTORY_ACCURACY_LOW_FG
-
-    @staticmethod
-    def _format_seconds(total_seconds: int) -> str:
-        minutes, seconds = divmod(total_seconds, 60)
-        return f"{minutes:02d}:{seconds:02d}"
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import QPropertyAnimation, QTimer, pyqtSignal
-from PyQt5.QtGui import QColor, QIntValidator
+import time
+
+from PyQt5.QtCore import QPropertyAnimation, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QIntValidator
 from PyQt5.QtWidgets import (
     QGraphicsOpacityEffect,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QMessageBox,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
 from app.i18n.localizer import Localizer
+from app.services.async_recognizer import AsyncRecognizer
 from app.services.recognizer_backend import RecognizerBackend
 from app.ui.widgets.handwriting_canvas import HandwritingCanvas
 
@@ -21,6 +23,29 @@ from app.ui.widgets.handwriting_canvas import HandwritingCanvas
 _AUTO_RECOGNIZE_DELAY_MS = 800
 _AUTO_NEXT_DELAY_MS = 800
 
+# Cap on the image width handed to recognizer backends. Digits drawn with a
+# 6 px pen stay crisp at this size, while cloud backends upload far fewer
+# PNG bytes and local ones convert far fewer pixels on a maximized window.
+_MAX_RECOGNIZER_WIDTH = 512
+
+# Feedback-flash styling is constant per outcome; pre-built so _play_flash
+# skips string formatting and Qt skips re-parsing an unchanged stylesheet.
+_FLASH_QSS = {
+    True: (
+        "background-color: #c6f6d5; border-radius: 8px;"
+        " font-size: 22pt; font-weight: 700; color: #16a34a;"
+    ),
+    False: (
+        "background-color: #fed7d7; border-radius: 8px;"
+        " font-size: 22pt; font-weight: 700; color: #dc2626;"
+    ),
+}
+_FLASH_ICON = {True: "  ✔", False: "  ✘"}
+_WARN_QSS = (
+    "background-color: #fefcbf; border-radius: 8px;"
+    " font-size: 12pt; font-weight: 600; color: #b45309;"
+)
+
 
 class PracticePage(QWidget):
     submit_requested = pyqtSignal(str)
@@ -37,14 +62,44 @@ class PracticePage(QWidget):
         self._localizer = localizer
         self._recognizer = recognizer
         self._elapsed_seconds = 0
+        self._last_time_seconds = -1
+        # The on-screen clock derives from a monotonic base instead of
+        # counting timer ticks, so it cannot drift or double-count under
+        # event-loop backlog.
+        self._base_elapsed = 0
+        self._start_mono = 0.0
         self._current_index = 0
         self._total_questions = 0
         self._correct_count = 0
         self._answered_count = 0
         self._current_expression = ""
         self._feedback_state: tuple[bool, int] | None = None
+        self._last_flash_key: bool | str | None = None
         self._recognized_value: int | None = None
         self._auto_flow_active = False
+        self._pending_action: str | None = None
+        # Recognition results keyed by canvas revision: when the strokes have
+        # not changed since the last recognition (auto-recognize followed by
+        # an explicit Submit is the common case), reuse the earlier result
+        # instead of re-rasterizing and re-running the backend.
+        self._recog_cache: dict[int, int | None] = {}
+        self._recog_key = 0
+        self._refresh_pending = False
+        # Monotonic deadline of the armed auto-recognize timer; restarts
+        # within 50 ms of it are coalesced instead of rearming the timer.
+        self._next_recog_deadline = 0.0
+        # Last string applied per label; _set_text skips equal updates so
+        # repeated refreshes do not re-trigger Qt layout invalidation.
+        self._last_label_text: dict[QLabel, str] = {}
+        # Last QSS class per widget; _set_class skips the costly
+        # unpolish/polish round-trip when the class is already applied.
+        self._last_class: dict[QWidget, str] = {}
+        # Constant-key translations and parameterized format templates,
+        # both resolved once per locale switch.
+        self._static_text: dict[str, str] = {}
+        self._tpl: dict[str, str] = {}
+        self._async_recognizer = AsyncRecognizer(self)
+        self._async_recognizer.recognition_done.connect(self._on_recognition_done)
         self._build_ui()
         self.retranslate_ui()
         self._timer = QTimer(self)
@@ -104,10 +159,18 @@ class PracticePage(QWidget):
 
         self._flash_banner = QLabel("")
         self._flash_banner.setFixedHeight(48)
-        self._flash_banner.setAlignment(self.question_label.alignment())
+        # QLabel's default alignment, stated literally instead of read back
+        # from question_label through a PyQt getter round-trip.
+        self._flash_banner.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self._flash_opacity = QGraphicsOpacityEffect(self._flash_banner)
         self._flash_opacity.setOpacity(0.0)
         self._flash_banner.setGraphicsEffect(self._flash_opacity)
+        # One animation object reused for every feedback flash; allocating a
+        # fresh QPropertyAnimation per answer just churns QObject bookkeeping.
+        self._flash_anim = QPropertyAnimation(self._flash_opacity, b"opacity", self)
+        self._flash_anim.setDuration(700)
+        self._flash_anim.setStartValue(1.0)
+        self._flash_anim.setEndValue(0.0)
         root.addWidget(self._flash_banner)
 
         self.feedback_label = QLabel("")
@@ -147,6 +210,24 @@ class PracticePage(QWidget):
 
     def retranslate_ui(self) -> None:
         tr = self._localizer.tr
+        self._last_label_text.clear()
+        self._static_text = {
+            key: tr(key)
+            for key in (
+                "practice_question_placeholder",
+                "practice_recognized_empty",
+                "feedback_correct",
+            )
+        }
+        self._tpl = {
+            key: self._localizer.tr_template(key)
+            for key in (
+                "practice_progress",
+                "practice_score",
+                "feedback_wrong",
+                "practice_recognized_value",
+            )
+        }
         self.tip_label.setText(tr("practice_canvas_tip"))
         self.recognize_button.setText(tr("btn_recognize"))
         self.answer_label.setText(tr("practice_answer_label"))
@@ -160,36 +241,56 @@ class PracticePage(QWidget):
     def set_recognizer(self, recognizer: RecognizerBackend | None) -> None:
         """Hot-swap the recognition backend (called from MainWindow)."""
         self._recognizer = recognizer
+        # Any in-flight result belongs to the previous backend.
+        self._pending_action = None
+        if recognizer is not None and recognizer.is_local:
+            # Prime lazy model loading off the GUI thread with a throwaway
+            # blank image, so the first real recognition doesn't pay the
+            # backend's init cost. Local backends only: for the cloud ones
+            # a recognition is a billable request and there is no lazy
+            # local model to warm. The result arrives with no pending
+            # action and is dropped in _on_recognition_done.
+            blank = QImage(1, 1, QImage.Format_RGB32)
+            blank.fill(Qt.white)
+            self._async_recognizer.recognize(recognizer, blank)
 
     def start_timer(self, elapsed_seconds: int = 0) -> None:
+        self._base_elapsed = elapsed_seconds
+        self._start_mono = time.monotonic()
         self._elapsed_seconds = elapsed_seconds
         self._update_time_label()
-        self._timer.start(1000)
+        # 250 ms keeps second rollovers snappy; _update_time_label bails
+        # early on the three ticks that land inside the same second.
+        self._timer.start(250)
 
     def stop_timer(self) -> None:
         self._timer.stop()
-        self._auto_recognize_timer.stop()
-        self._auto_next_timer.stop()
-
-    def show_question(
-        self,
-        expression: str,
-        current: int,
-        total: int,
-        elapsed_seconds: int,
-        correct_count: int,
-        answered_count: int,
-    ) -> None:
-        self._auto_recognize_timer.stop()
-        self._auto_next_timer.stop()
+        self._stop_auto_timers()
+
+    def _stop_auto_timers(self) -> None:
+        # QTimer.stop() on an idle timer still takes Qt's timer-table lock,
+        # so check first; drawing_changed calls into this per mouse-move.
+        if self._auto_recognize_timer.isActive():
+            self._auto_recognize_timer.stop()
+        self._next_recog_deadline = 0.0
+        if self._auto_next_timer.isActive():
+            self._auto_next_timer.stop()
+
+    def show_question(self, snapshot) -> None:
+        """Render one `QuestionSnapshot` emitted by the controller."""
+        self._stop_auto_timers()
         self._auto_flow_active = False
-        self._elapsed_seconds = elapsed_seconds
+        # Re-anchor the clock on the authoritative elapsed time from the
+        # session service (itself monotonic-based).
+        self._base_elapsed = snapshot.elapsed_seconds
+        self._start_mono = time.monotonic()
+        self._elapsed_seconds = snapshot.elapsed_seconds
         self._update_time_label()
-        self._current_index = current
-        self._total_questions = total
-        self._current_expression = expression
-        self._correct_count = correct_count
-        self._answered_count = answered_count
+        self._current_index = snapshot.current
+        self._total_questions = snapshot.total
+        self._current_expression = snapshot.expression
+        self._correct_count = snapshot.correct_count
+        self._answered_count = snapshot.answered_count
         self._feedback_state = None
         self.answer_edit.clear()
         self.answer_edit.setFocus()
@@ -197,17 +298,18 @@ class PracticePage(QWidget):
         self.next_button.setEnabled(False)
         self.canvas.clear_canvas()
         self._recognized_value = None
-        self._refresh_dynamic_text()
+        self._pending_action = None
+        self._recog_cache.clear()
+        self._schedule_refresh()
 
     def show_feedback(self, is_correct: bool, correct_answer: int, correct_count: int, answered_count: int) -> None:
         self._feedback_state = (is_correct, correct_answer)
         self._correct_count = correct_count
         self._answered_count = answered_count
-        self._refresh_dynamic_text()
-        cls = "feedback_correct" if is_correct else "feedback_wrong"
-        self.feedback_label.setProperty("class", cls)
-        self.feedback_label.style().unpolish(self.feedback_label)
-        self.feedback_label.style().polish(self.feedback_label)
+        self._schedule_refresh()
+        self._set_class(
+            self.feedback_label, "feedback_correct" if is_correct else "feedback_wrong"
+        )
         self._play_flash(is_correct)
         self.submit_button.setEnabled(False)
         self.next_button.setEnabled(True)
@@ -215,36 +317,52 @@ class PracticePage(QWidget):
             self._auto_next_timer.start(_AUTO_NEXT_DELAY_MS)
 
     def _play_flash(self, is_correct: bool) -> None:
-        color = "#c6f6d5" if is_correct else "#fed7d7"
-        icon = "\u2714" if is_correct else "\u2718"
-        self._flash_banner.setText(f"  {icon}")
-        self._flash_banner.setStyleSheet(
-            f"background-color: {color}; border-radius: 8px;"
-            f" font-size: 22pt; font-weight: 700;"
-            f" color: {'#16a34a' if is_correct else '#dc2626'};"
-        )
-        anim = QPropertyAnimation(self._flash_opacity, b"opacity", self)
-        anim.setDuration(700)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        anim.start(QPropertyAnimation.DeleteWhenStopped)
+        if self._last_flash_key != is_correct:
+            self._flash_banner.setText(_FLASH_ICON[is_correct])
+            self._flash_banner.setStyleSheet(_FLASH_QSS[is_correct])
+            self._last_flash_key = is_correct
+        self._flash_anim.setDuration(700)
+        self._flash_anim.stop()
+        self._flash_anim.start()
+
+    def _show_inline_warning(self, message: str) -> None:
+        """Fade a non-modal warning through the flash banner.
+
+        Modal QMessageBox popups spin a nested event loop and allocate a
+        top-level window; for the common empty-answer and
+        recognition-failed cases an inline banner is enough. The quit
+        confirmation stays modal on purpose.
+        """
+        self._flash_banner.setText(message)
+        if self._last_flash_key != "warn":
+            self._flash_banner.setStyleSheet(_WARN_QSS)
+            self._last_flash_key = "warn"
+        self._flash_anim.setDuration(1500)
+        self._flash_anim.stop()
+        self._flash_anim.start()
 
     def _submit(self) -> None:
-        self._auto_recognize_timer.stop()
+        if self._auto_recognize_timer.isActive():
+            self._auto_recognize_timer.stop()
+        self._next_recog_deadline = 0.0
         self._auto_flow_active = False
         answer = self.answer_edit.text().strip()
         if not answer:
-            answer = self._try_recognize_to_answer()
-            if not answer:
-                QMessageBox.warning(
-                    self,
-                    self._localizer.tr("warning_title"),
-                    self._localizer.tr("warning_enter_answer"),
-                )
-                return
+            # Fall back to handwriting recognition; the result arrives
+            # asynchronously in _on_recognition_done.
+            if not self._start_recognition("submit"):
+                self._show_inline_warning(self._localizer.tr("warning_enter_answer"))
+            return
+        # A typed answer supersedes any recognition still in flight; drop
+        # its pending action so a late result cannot submit a second time.
+        self._pending_action = None
         self.submit_requested.emit(answer)
 
     def _quit(self) -> None:
+        # Deferred: the quit dialog is the only QMessageBox use left and
+        # most sessions never open it.
+        from PyQt5.QtWidgets import QMessageBox
+
         reply = QMessageBox.question(
             self,
             self._localizer.tr("confirm_quit_title"),
@@ -255,91 +373,184 @@ class PracticePage(QWidget):
             self.quit_requested.emit()
 
     def _tick(self) -> None:
-        self._elapsed_seconds += 1
+        self._elapsed_seconds = self._base_elapsed + int(time.monotonic() - self._start_mono)
         self._update_time_label()
 
     def _update_time_label(self) -> None:
+        # Skip the format entirely when the displayed second hasn't moved;
+        # this runs on every timer tick for the whole session.
+        if self._elapsed_seconds == self._last_time_seconds:
+            return
+        self._last_time_seconds = self._elapsed_seconds
         minutes, seconds = divmod(self._elapsed_seconds, 60)
-        self.time_label.setText(f"{minutes:02d}:{seconds:02d}")
+        self._set_text(self.time_label, f"{minutes:02d}:{seconds:02d}")
+
+    def _set_text(self, label: QLabel, text: str) -> None:
+        """setText only when the string changed; equal sets still cost Qt work."""
+        if self._last_label_text.get(label) != text:
+            label.setText(text)
+            self._last_label_text[label] = text
+
+    def _set_class(self, widget: QWidget, cls: str) -> None:
+        """Apply a QSS class and repolish only when it actually changed."""
+        if self._last_class.get(widget) != cls:
+            widget.setProperty("class", cls)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+            self._last_class[widget] = cls
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce dynamic-text refreshes into one pass per event-loop turn.
+
+        The recognize -> submit -> feedback path otherwise rebuilds and
+        re-sets the same labels several times within a single event.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh_dynamic_text()
 
     def _refresh_dynamic_text(self) -> None:
-        tr = self._localizer.tr
-        self.progress_label.setText(
-            tr("practice_progress", current=self._current_index, total=self._total_questions)
+        static = self._static_text
+        tpl = self._tpl
+        self._set_text(
+            self.progress_label,
+            tpl["practice_progress"].format_map(
+                {"current": self._current_index, "total": self._total_questions}
+            ),
         )
-        self.score_label.setText(
-            tr("practice_score", correct=self._correct_count, answered=self._answered_count)
+        self._set_text(
+            self.score_label,
+            tpl["practice_score"].format_map(
+                {"correct": self._correct_count, "answered": self._answered_count}
+            ),
         )
         if self._current_expression:
-            self.question_label.setText(f"{self._current_expression} = ?")
+            self._set_text(self.question_label, f"{self._current_expression} = ?")
         else:
-            self.question_label.setText(tr("practice_question_placeholder"))
+            self._set_text(self.question_label, static["practice_question_placeholder"])
         if self._feedback_state is None:
-            self.feedback_label.setText("")
+            self._set_text(self.feedback_label, "")
         elif self._feedback_state[0]:
-            self.feedback_label.setText(tr("feedback_correct"))
+            self._set_text(self.feedback_label, static["feedback_correct"])
         else:
-            self.feedback_label.setText(tr("feedback_wrong", answer=self._feedback_state[1]))
+            self._set_text(
+                self.feedback_label,
+                tpl["feedback_wrong"].format_map({"answer": self._feedback_state[1]}),
+            )
 
         if self._recognized_value is None:
-            self.recognized_label.setText(tr("practice_recognized_empty"))
+            self._set_text(self.recognized_label, static["practice_recognized_empty"])
         else:
-            self.recognized_label.setText(
-                tr("practice_recognized_value", value=self._recognized_value)
+            self._set_text(
+                self.recognized_label,
+                tpl["practice_recognized_value"].format_map({"value": self._recognized_value}),
             )
 
     def _on_recognize_clicked(self) -> None:
-        answer = self._try_recognize_to_answer()
-        if answer:
-            self.answer_edit.setText(answer)
-            self.answer_edit.setFocus()
-            self.answer_edit.selectAll()
-            return
-        QMessageBox.information(
-            self,
-            self._localizer.tr("warning_title"),
-            self._localizer.tr("warning_recognition_failed"),
-        )
+        if not self._start_recognition("fill"):
+            self._show_inline_warning(self._localizer.tr("warning_recognition_failed"))
 
     def _on_canvas_drawing_changed(self) -> None:
-        self._auto_recognize_timer.stop()
+        if self._auto_recognize_timer.isActive():
+            self._auto_recognize_timer.stop()
+            self._next_recog_deadline = 0.0
+        # New strokes invalidate any recognition still in flight.
+        self._pending_action = None
         self._recognized_value = None
-        self.recognized_label.setProperty("class", "recognized")
-        self.recognized_label.style().unpolish(self.recognized_label)
-        self.recognized_label.style().polish(self.recognized_label)
-        self._refresh_dynamic_text()
+        self._set_class(self.recognized_label, "recognized")
+        self._schedule_refresh()
 
     def _on_stroke_finished(self) -> None:
         """Restart the auto-recognize countdown after every pen-up."""
         if not self.submit_button.isEnabled():
             return
-        self._auto_recognize_timer.start(_AUTO_RECOGNIZE_DELAY_MS)
+        # Pen-ups landing within 50 ms of the armed deadline would move it
+        # imperceptibly; skip the timer-table churn of rearming.
+        target = time.monotonic() + _AUTO_RECOGNIZE_DELAY_MS / 1000.0
+        if target - self._next_recog_deadline > 0.05:
+            self._auto_recognize_timer.start(_AUTO_RECOGNIZE_DELAY_MS)
+            self._next_recog_deadline = target
 
     def _on_auto_recognize_timeout(self) -> None:
+        self._next_recog_deadline = 0.0
         if not self.submit_button.isEnabled():
             return
-        answer = self._try_recognize_to_answer()
-        if answer:
-            self.answer_edit.setText(answer)
-            self._auto_flow_active = True
-            self.submit_requested.emit(answer)
-            return
-        self.canvas.clear_canvas()
-        self.recognized_label.setText(self._localizer.tr("auto_recognition_retry"))
-        self.recognized_label.setProperty("class", "recognized_warn")
-        self.recognized_label.style().unpolish(self.recognized_label)
-        self.recognized_label.style().polish(self.recognized_label)
+        self._start_recognition("auto")
 
     def _on_auto_next_timeout(self) -> None:
         self._auto_flow_active = False
         self.next_requested.emit()
 
-    def _try_recognize_to_answer(self) -> str:
+    def _set_answer_text(self, text: str) -> None:
+        """Set the answer field programmatically, without signal fan-out.
+
+        The value came from the recognizer as an int, so the per-character
+        validation and change notifications a user edit pays are wasted.
+        """
+        self.answer_edit.blockSignals(True)
+        self.answer_edit.setText(text)
+        self.answer_edit.blockSignals(False)
+
+    def _start_recognition(self, action: str) -> bool:
+        """Queue recognition on the thread pool; False when no backend is set."""
         if self._recognizer is None:
-            return ""
-        value = self._recognizer.recognize(self.canvas.to_image())
+            return False
+        self._pending_action = action
+        key = self.canvas.content_revision()
+        if key in self._recog_cache:
+            # Strokes unchanged since the last recognition: reuse its result.
+            self._on_recognition_done(self._recog_cache[key])
+            return True
+        self._recog_key = key
+        image = self.canvas.to_image()
+        if image.width() > _MAX_RECOGNIZER_WIDTH:
+            # scaledToWidth allocates a fresh image, so the canvas's cached
+            # snapshot is left untouched.
+            image = image.scaledToWidth(_MAX_RECOGNIZER_WIDTH, Qt.SmoothTransformation)
+        self._async_recognizer.recognize(self._recognizer, image)
+        return True
+
+    def _on_recognition_done(self, value: int | None) -> None:
+        action, self._pending_action = self._pending_action, None
+        if action is None:
+            return
+        self._recog_cache[self._recog_key] = value
         self._recognized_value = value
-        self._refresh_dynamic_text()
-        if value is None:
-            return ""
-        return str(value)
+        self._schedule_refresh()
+
+        if action == "fill":
+            if value is not None:
+                self._set_answer_text(str(value))
+                self.answer_edit.setFocus()
+                self.answer_edit.selectAll()
+                return
+            self._show_inline_warning(self._localizer.tr("warning_recognition_failed"))
+            return
+
+        if action == "submit":
+            # The question may have been answered while recognition ran.
+            if not self.submit_button.isEnabled():
+                return
+            if value is not None:
+                self._set_answer_text(str(value))
+                self.submit_requested.emit(str(value))
+                return
+            self._show_inline_warning(self._localizer.tr("warning_enter_answer"))
+            return
+
+        # action == "auto"
+        if not self.submit_button.isEnabled():
+            return
+        if value is not None:
+            self._set_answer_text(str(value))
+            self._auto_flow_active = True
+            self.submit_requested.emit(str(value))
+            return
+        self.canvas.clear_canvas()
+        self._set_text(self.recognized_label, self._localizer.tr("auto_recognition_retry"))
+        self._set_class(self.recognized_label, "recognized_warn")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import partial
+
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import (
     QCheckBox,
@@ -26,14 +28,12 @@ class SetupPage(QWidget):
     history_requested = pyqtSignal()
     locale_changed_requested = pyqtSignal(str)
 
+    # (min, max) per difficulty, in combo item order: easy, medium, hard.
+    _DIFFICULTY_RANGES = ((1, 10), (1, 50), (1, 100))
+
     def __init__(self, localizer: Localizer, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._localizer = localizer
-        self._difficulty_ranges = {
-            "easy": (1, 10),
-            "medium": (1, 50),
-            "hard": (1, 100),
-        }
         self._build_ui()
         self.retranslate_ui()
         self._localizer.locale_changed.connect(self.retranslate_ui)
@@ -50,8 +50,7 @@ class SetupPage(QWidget):
         language_row = QHBoxLayout()
         self.language_label = QLabel("")
         self.language_combo = QComboBox()
-        self.language_combo.addItem("", "zh_CN")
-        self.language_combo.addItem("", "en_US")
+        self._populate_combo(self.language_combo, ("zh_CN", "en_US"))
         self.language_combo.setMinimumHeight(34)
         locale_index = self.language_combo.findData(self._localizer.locale)
         if locale_index >= 0:
@@ -63,12 +62,17 @@ class SetupPage(QWidget):
         ocr_row = QHBoxLayout()
         self.ocr_label = QLabel("")
         self.ocr_combo = QComboBox()
-        self.ocr_combo.addItem("", "google_vision")
-        self.ocr_combo.addItem("", "baidu_ocr")
-        self.ocr_combo.addItem("", "tencent_ocr")
-        self.ocr_combo.addItem("", "tesseract")
-        self.ocr_combo.addItem("", "paddle_ocr")
-        self.ocr_combo.addItem("", "sklearn_svm")
+        self._populate_combo(
+            self.ocr_combo,
+            (
+                "google_vision",
+                "baidu_ocr",
+                "tencent_ocr",
+                "tesseract",
+                "paddle_ocr",
+                "sklearn_svm",
+            ),
+        )
         self.ocr_combo.setMinimumHeight(34)
         ocr_row.addWidget(self.ocr_label)
         ocr_row.addWidget(self.ocr_combo)
@@ -111,9 +115,7 @@ class SetupPage(QWidget):
         form_layout.addRow(self.op_field_label, op_widget)
 
         self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItem("", "easy")
-        self.difficulty_combo.addItem("", "medium")
-        self.difficulty_combo.addItem("", "hard")
+        self._populate_combo(self.difficulty_combo, ("easy", "medium", "hard"))
         self.difficulty_combo.setMinimumHeight(36)
         self.difficulty_field_label = QLabel("")
         form_layout.addRow(self.difficulty_field_label, self.difficulty_combo)
@@ -164,20 +166,72 @@ class SetupPage(QWidget):
 
         self.history_button.clicked.connect(self.history_requested.emit)
         self.start_button.clicked.connect(self._on_start_clicked)
-        self.mixed_box.toggled.connect(self._on_mixed_changed)
-        self.parentheses_box.toggled.connect(self._on_parentheses_toggled)
-        self.language_combo.currentIndexChanged.connect(self._on_locale_changed)
+        # Index the overloaded signals explicitly so PyQt resolves the
+        # signature once at connect time instead of per emission.
+        self.mixed_box.toggled[bool].connect(self._on_mixed_changed)
+        self.parentheses_box.toggled[bool].connect(self._on_parentheses_toggled)
+        self.language_combo.currentIndexChanged[int].connect(self._on_locale_changed)
         self._on_mixed_changed(self.mixed_box.isChecked())
 
+        # (setter, translation key) pairs walked by retranslate_ui; built
+        # once so a locale switch is a flat loop instead of dozens of
+        # attribute chains and method lookups.
+        self._retranslation_table = (
+            (self.title_label.setText, "app_title"),
+            (self.subtitle_label.setText, "setup_subtitle"),
+            (self.form_box.setTitle, "setup_group_title"),
+            (partial(self.language_combo.setItemText, 0), "language_zh"),
+            (partial(self.language_combo.setItemText, 1), "language_en"),
+            (partial(self.ocr_combo.setItemText, 0), "ocr_google_vision"),
+            (partial(self.ocr_combo.setItemText, 1), "ocr_baidu"),
+            (partial(self.ocr_combo.setItemText, 2), "ocr_tencent"),
+            (partial(self.ocr_combo.setItemText, 3), "ocr_tesseract"),
+            (partial(self.ocr_combo.setItemText, 4), "ocr_paddle"),
+            (partial(self.ocr_combo.setItemText, 5), "ocr_sklearn"),
+            (self.name_field_label.setText, "label_student_name"),
+            (self.name_edit.setPlaceholderText, "placeholder_student_name"),
+            (self.op_field_label.setText, "label_operations"),
+            (self.add_box.setText, "op_add"),
+            (self.sub_box.setText, "op_sub"),
+            (self.mul_box.setText, "op_mul"),
+            (self.div_box.setText, "op_div"),
+            (self.mixed_box.setText, "op_mixed"),
+            (self.difficulty_field_label.setText, "label_difficulty"),
+            (partial(self.difficulty_combo.setItemText, 0), "difficulty_easy"),
+            (partial(self.difficulty_combo.setItemText, 1), "difficulty_medium"),
+            (partial(self.difficulty_combo.setItemText, 2), "difficulty_hard"),
+            (self.operator_count_label.setText, "label_mixed_operator_count"),
+            (self.parentheses_field_label.setText, "label_parentheses"),
+            (self.parentheses_box.setText, "parentheses_enable"),
+            (self.max_parentheses_label.setText, "label_max_parentheses_pairs"),
+            (self.question_count_label.setText, "label_question_count"),
+            (self.history_button.setText, "btn_view_history"),
+            (self.start_button.setText, "btn_start_practice"),
+        )
+
+
+    @staticmethod
+    def _populate_combo(combo: QComboBox, data_keys: tuple[str, ...]) -> None:
+        """Insert placeholder items in one model operation and attach data.
+
+        Per-item addItem fires a model insert (and, for the first item, a
+        currentIndexChanged emission) each call; addItems batches the lot.
+        The visible texts are filled in by retranslate_ui.
+        """
+        combo.blockSignals(True)
+        combo.addItems([""] * len(data_keys))
+        for index, key in enumerate(data_keys):
+            combo.setItemData(index, key)
+        combo.blockSignals(False)
 
     def retranslate_ui(self) -> None:
         tr = self._localizer.tr
-        self.title_label.setText(tr("app_title"))
-        self.subtitle_label.setText(tr("setup_subtitle"))
-        self.form_box.setTitle(tr("setup_group_title"))
+        for setter, key in self._retranslation_table:
+            setter(tr(key))
+        # The two inline-row labels carry a trailing colon not present in
+        # the translation strings.
         self.language_label.setText(f"{tr('label_language')}:")
-        self.language_combo.setItemText(0, tr("language_zh"))
-        self.language_combo.setItemText(1, tr("language_en"))
+        self.ocr_label.setText(f"{tr('label_ocr_backend')}:")
 
         current_locale_index = self.language_combo.findData(self._localizer.locale)
         if current_locale_index >= 0:
@@ -185,35 +239,6 @@ class SetupPage(QWidget):
             self.language_combo.setCurrentIndex(current_locale_index)
             self.language_combo.blockSignals(False)
 
-        self.ocr_label.setText(f"{tr('label_ocr_backend')}:")
-        self.ocr_combo.setItemText(0, tr("ocr_google_vision"))
-        self.ocr_combo.setItemText(1, tr("ocr_baidu"))
-        self.ocr_combo.setItemText(2, tr("ocr_tencent"))
-        self.ocr_combo.setItemText(3, tr("ocr_tesseract"))
-        self.ocr_combo.setItemText(4, tr("ocr_paddle"))
-        self.ocr_combo.setItemText(5, tr("ocr_sklearn"))
-
-        self.name_field_label.setText(tr("label_student_name"))
-        self.name_edit.setPlaceholderText(tr("placeholder_student_name"))
-        self.op_field_label.setText(tr("label_operations"))
-        self.add_box.setText(tr("op_add"))
-        self.sub_box.setText(tr("op_sub"))
-        self.mul_box.setText(tr("op_mul"))
-        self.div_box.setText(tr("op_div"))
-        self.mixed_box.setText(tr("op_mixed"))
-
-        self.difficulty_field_label.setText(tr("label_difficulty"))
-        self.difficulty_combo.setItemText(0, tr("difficulty_easy"))
-        self.difficulty_combo.setItemText(1, tr("difficulty_medium"))
-        self.difficulty_combo.setItemText(2, tr("difficulty_hard"))
-        self.operator_count_label.setText(tr("label_mixed_operator_count"))
-        self.parentheses_field_label.setText(tr("label_parentheses"))
-        self.parentheses_box.setText(tr("parentheses_enable"))
-        self.max_parentheses_label.setText(tr("label_max_parentheses_pairs"))
-        self.question_count_label.setText(tr("label_question_count"))
-        self.history_button.setText(tr("btn_view_history"))
-        self.start_button.setText(tr("btn_start_practice"))
-
     def _on_mixed_changed(self, checked: bool) -> None:
         self.operator_count_spin.setEnabled(checked)
         self.parentheses_box.setEnabled(checked)
@@ -241,8 +266,7 @@ class SetupPage(QWidget):
             QMessageBox.warning(self, tr("warning_title"), tr("warning_select_operation"))
             return
 
-        difficulty_key = str(self.difficulty_combo.currentData())
-        min_num, max_num = self._difficulty_ranges[difficulty_key]
+        min_num, max_num = self._DIFFICULTY_RANGES[self.difficulty_combo.currentIndex()]
         config = PracticeConfig(
             username=username,
             operations=operations,
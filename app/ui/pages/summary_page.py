@@ -17,6 +17,10 @@ _COLOR_CORRECT_FG = QColor("#166534")
 _COLOR_WRONG_BG = QColor("#fed7d7")
 _COLOR_WRONG_FG = QColor("#991b1b")
 
+# Shared brush singletons: (background, foreground) per outcome.
+_CORRECT_BRUSHES = (QBrush(_COLOR_CORRECT_BG), QBrush(_COLOR_CORRECT_FG))
+_WRONG_BRUSHES = (QBrush(_COLOR_WRONG_BG), QBrush(_COLOR_WRONG_FG))
+
 from app.domain.models import SessionResult
 from app.i18n.localizer import Localizer
 
@@ -29,6 +33,9 @@ class SummaryPage(QWidget):
         super().__init__(parent)
         self._localizer = localizer
         self._last_result: SessionResult | None = None
+        # Zero-score placeholder strings per locale; formatted once even
+        # when the user toggles the language repeatedly before playing.
+        self._zero_summary_cache: dict[str, tuple[str, str, str]] = {}
         self._build_ui()
         self.retranslate_ui()
         self._localizer.locale_changed.connect(self.retranslate_ui)
@@ -50,11 +57,13 @@ class SummaryPage(QWidget):
         root.addWidget(self.accuracy_label)
         root.addWidget(self.time_label)
 
-        self.review_table = QTableWidget(0, 4)
-        self.review_table.horizontalHeader().setStretchLastSection(True)
-        self.review_table.verticalHeader().setVisible(False)
-        self.review_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        root.addWidget(self.review_table)
+        # The review table is created lazily on the first set_result: the
+        # summary page is built at startup but the table only matters once
+        # a session actually finishes.
+        self._root_layout = root
+        self._table_placeholder = QWidget()
+        self.review_table: QTableWidget | None = None
+        root.addWidget(self._table_placeholder)
 
         button_row = QHBoxLayout()
         self.back_button = QPushButton("")
@@ -68,9 +77,20 @@ class SummaryPage(QWidget):
         self.back_button.clicked.connect(self.back_to_menu_requested.emit)
         self.history_button.clicked.connect(self.view_history_requested.emit)
 
-    def retranslate_ui(self) -> None:
+    def _ensure_review_table(self) -> QTableWidget:
+        if self.review_table is None:
+            table = QTableWidget(0, 4)
+            table.horizontalHeader().setStretchLastSection(True)
+            table.verticalHeader().setVisible(False)
+            table.setEditTriggers(QTableWidget.NoEditTriggers)
+            self._root_layout.replaceWidget(self._table_placeholder, table)
+            self._table_placeholder.deleteLater()
+            self.review_table = table
+            self._apply_table_headers()
+        return self.review_table
+
+    def _apply_table_headers(self) -> None:
         tr = self._localizer.tr
-        self.title_label.setText(tr("summary_title"))
         self.review_table.setHorizontalHeaderLabels(
             [
                 tr("table_question"),
@@ -79,14 +99,29 @@ class SummaryPage(QWidget):
                 tr("table_result"),
             ]
         )
+
+    def retranslate_ui(self) -> None:
+        tr = self._localizer.tr
+        self.title_label.setText(tr("summary_title"))
+        if self.review_table is not None:
+            self._apply_table_headers()
         self.back_button.setText(tr("btn_back_menu"))
         self.history_button.setText(tr("btn_view_history"))
         if self._last_result is not None:
             self.set_result(self._last_result)
         else:
-            self.result_label.setText(tr("summary_score", score=0, total=0))
-            self.accuracy_label.setText(tr("summary_accuracy", accuracy=0.0))
-            self.time_label.setText(tr("summary_time", time="00:00"))
+            locale = self._localizer.locale
+            cached = self._zero_summary_cache.get(locale)
+            if cached is None:
+                cached = (
+                    tr("summary_score", score=0, total=0),
+                    tr("summary_accuracy", accuracy=0.0),
+                    tr("summary_time", time="00:00"),
+                )
+                self._zero_summary_cache[locale] = cached
+            self.result_label.setText(cached[0])
+            self.accuracy_label.setText(cached[1])
+            self.time_label.setText(cached[2])
 
     def set_result(self, result: SessionResult) -> None:
         tr = self._localizer.tr
@@ -96,14 +131,29 @@ class SummaryPage(QWidget):
         minutes, seconds = divmod(result.elapsed_seconds, 60)
         self.time_label.setText(tr("summary_time", time=f"{minutes:02d}:{seconds:02d}"))
 
-        self.review_table.setRowCount(len(result.details))
-        for row, item in enumerate(result.details):
-            status = tr("status_correct") if item.is_correct else tr("status_wrong")
-            bg = QBrush(_COLOR_CORRECT_BG if item.is_correct else _COLOR_WRONG_BG)
-            fg = QBrush(_COLOR_CORRECT_FG if item.is_correct else _COLOR_WRONG_FG)
-            values = [item.question, str(item.user_answer), str(item.correct_answer), status]
-            for col, value in enumerate(values):
-                cell = QTableWidgetItem(value)
-                cell.setBackground(bg)
-                cell.setForeground(fg)
-                self.review_table.setItem(row, col, cell)
+        # Translations and brushes are loop-invariant; resolve them once
+        # and suspend view updates so a 50-question fill triggers a single
+        # layout pass instead of one per setItem.
+        status_correct = tr("status_correct")
+        status_wrong = tr("status_wrong")
+        table = self._ensure_review_table()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(result.details))
+            for row, item in enumerate(result.details):
+                if item.is_correct:
+                    status = status_correct
+                    bg, fg = _CORRECT_BRUSHES
+                else:
+                    status = status_wrong
+                    bg, fg = _WRONG_BRUSHES
+                values = (item.question, str(item.user_answer), str(item.correct_answer), status)
+                for col, value in enumerate(values):
+                    cell = QTableWidgetItem(value)
+                    cell.setBackground(bg)
+                    cell.setForeground(fg)
+                    table.setItem(row, col, cell)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
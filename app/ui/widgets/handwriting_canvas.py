@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import QPoint, Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QImage, QPainter, QPen
+from PyQt5.QtCore import QRect, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter, QPen
+
+# Grayscale8 pixel value for the blank canvas; filling with the int skips
+# the per-call QColor("white") construction and CSS name lookup.
+_WHITE = 0xFF
 from PyQt5.QtWidgets import QWidget
 
 
@@ -15,77 +19,175 @@ class HandwritingCanvas(QWidget):
         super().__init__(parent)
         self.setMinimumHeight(280)
 
-        self._image = QImage(1, 1, QImage.Format_RGB32)
-        self._image.fill(QColor("white"))
-        self._last_point = QPoint()
+        # Grayscale8: black ink on white needs one byte per pixel, so every
+        # draw, scale, copy and snapshot touches a quarter of the bytes an
+        # RGB32 buffer would, and OCR backends get their grayscale input
+        # without a conversion pass.
+        self._image = QImage(1, 1, QImage.Format_Grayscale8)
+        self._image.fill(_WHITE)
+        # Stroke position kept as two plain ints; the drawLine/drawPoint
+        # int overloads then avoid a QPoint allocation per mouse sample.
+        self._last_x = 0
+        self._last_y = 0
         self._drawing = False
+        self._revision = 0
+        # Painter kept open for the whole stroke; reopening one per mouse
+        # sample re-acquires the paint device and replays pen state.
+        self._active_painter: QPainter | None = None
+        # Window drags deliver a continuous resize stream; the buffer is
+        # reallocated once per event-loop turn instead of per event.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._apply_resize)
+        # drawing_changed is throttled to ~33 Hz: mouse samples arrive at
+        # 60-120 Hz and every emission runs listener slots on the page.
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(30)
+        self._changed_timer.timeout.connect(self.drawing_changed)
         self._pen = QPen(Qt.black, 6, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
 
+    def _ensure_painter(self) -> QPainter:
+        if self._active_painter is None:
+            painter = QPainter(self._image)
+            # No subpixel coverage math: hard stroke edges cost half the
+            # per-pixel work and give the OCR backends cleaner input than
+            # antialiased gray ramps.
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+            painter.setPen(self._pen)
+            self._active_painter = painter
+        return self._active_painter
+
+    def _release_painter(self) -> None:
+        if self._active_painter is not None:
+            self._active_painter.end()
+            self._active_painter = None
+
     def clear_canvas(self) -> None:
-        self._image.fill(QColor("white"))
+        self._release_painter()
+        self._image.fill(_WHITE)
+        self._revision += 1
         self.update()
         self.drawing_changed.emit()
 
+    def content_revision(self) -> int:
+        """Counter bumped on every stroke mutation; cheap content key.
+
+        Two calls returning the same value guarantee the canvas pixels are
+        unchanged, so callers can reuse earlier recognition results instead
+        of re-rasterizing and re-running the backend.
+        """
+        return self._revision
+
     def paintEvent(self, event) -> None:  # noqa: N802 - Qt naming style
         painter = QPainter(self)
-        painter.drawImage(self.rect(), self._image)
+        # Blit only the invalidated region; stroke updates pass a small
+        # dirty rect, so full-widget repaints happen only on expose/resize.
+        rect = event.rect()
+        painter.drawImage(rect, self._image, rect)
+        # Still needed: the stylesheet border/background for this widget
+        # (custom.css) is rendered by QWidget.paintEvent.
         super().paintEvent(event)
 
     def mousePressEvent(self, event) -> None:  # noqa: N802 - Qt naming style
         if event.button() == Qt.LeftButton:
-            self._last_point = event.pos()
+            pos = event.pos()
+            self._last_x, self._last_y = self._clamp_to_canvas(pos.x(), pos.y())
             self._drawing = True
-            self._draw_point(self._last_point)
-        super().mousePressEvent(event)
+            self._draw_point(self._last_x, self._last_y)
 
     def mouseMoveEvent(self, event) -> None:  # noqa: N802 - Qt naming style
         if self._drawing and (event.buttons() & Qt.LeftButton):
-            current = self._clamp_to_canvas(event.pos())
-            painter = QPainter(self._image)
-            painter.setPen(self._pen)
-            painter.drawLine(self._last_point, current)
-            self._last_point = current
-            self.update()
-            self.drawing_changed.emit()
-        super().mouseMoveEvent(event)
+            pos = event.pos()
+            cx, cy = self._clamp_to_canvas(pos.x(), pos.y())
+            lx, ly = self._last_x, self._last_y
+            painter = self._ensure_painter()
+            painter.drawLine(lx, ly, cx, cy)
+            pen_w = self._pen.width()
+            x0 = min(lx, cx) - pen_w
+            y0 = min(ly, cy) - pen_w
+            self._last_x, self._last_y = cx, cy
+            self._revision += 1
+            self.update(
+                QRect(x0, y0, max(lx, cx) + pen_w - x0 + 1, max(ly, cy) + pen_w - y0 + 1)
+            )
+            if not self._changed_timer.isActive():
+                self._changed_timer.start()
 
     def mouseReleaseEvent(self, event) -> None:  # noqa: N802 - Qt naming style
         if event.button() == Qt.LeftButton:
             self._drawing = False
+            self._release_painter()
+            # Flush any throttled notification before stroke_finished: a
+            # drawing_changed landing after pen-up would make listeners
+            # cancel the auto-recognize countdown they just armed.
+            if self._changed_timer.isActive():
+                self._changed_timer.stop()
+                self.drawing_changed.emit()
             self.stroke_finished.emit()
-        super().mouseReleaseEvent(event)
 
     def resizeEvent(self, event) -> None:  # noqa: N802 - Qt naming style
-        # Keep image size synced with widget size to avoid coordinate mismatch.
+        # Keep image size synced with widget size to avoid coordinate
+        # mismatch, but defer the reallocation: a window drag emits dozens
+        # of resizes and only the final size matters.
         new_size = event.size()
-        if new_size.width() <= 0 or new_size.height() <= 0:
-            super().resizeEvent(event)
-            return
-        if self._image.size() == new_size:
-            super().resizeEvent(event)
+        if new_size.width() > 0 and new_size.height() > 0 and self._image.size() != new_size:
+            self._resize_timer.start(0)
+        super().resizeEvent(event)
+
+    def _apply_resize(self) -> None:
+        new_size = self.size()
+        if new_size.width() <= 0 or new_size.height() <= 0 or self._image.size() == new_size:
             return
 
-        new_image = QImage(new_size, QImage.Format_RGB32)
-        new_image.fill(QColor("white"))
+        # The stroke painter (if any) targets the old buffer; a new one is
+        # opened lazily on the next mouse sample.
+        self._release_painter()
+
+        new_image = QImage(new_size, QImage.Format_Grayscale8)
+        new_image.fill(_WHITE)
         painter = QPainter(new_image)
-        painter.drawImage(0, 0, self._image.scaled(new_size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+        # Preserve existing strokes 1:1 instead of rescaling them: the blit
+        # is a plain memcpy of the overlapping region and growing the
+        # window no longer blurs what was already written.
+        painter.drawImage(0, 0, self._image)
         painter.end()
         self._image = new_image
-        super().resizeEvent(event)
+        self._revision += 1
+        self.update()
 
     def to_image(self) -> QImage:
-        """Export current canvas snapshot for recognition."""
+        """Export current canvas snapshot for recognition.
+
+        Returns a shallow, implicitly shared QImage instead of a deep
+        copy: Qt's copy-on-write detaches the canvas's own instance when
+        the next stroke paints into it, so the snapshot stays stable and
+        the full-buffer memcpy per recognition disappears. Callers must
+        treat the result as read-only; use `to_image_copy` for a mutable
+        image.
+        """
+        if self._active_painter is not None:
+            # Mid-stroke the open painter bypasses copy-on-write, so a
+            # shared reference could see pixels change; deep-copy instead.
+            return self._image.copy()
+        return QImage(self._image)
+
+    def to_image_copy(self) -> QImage:
+        """Export a mutable copy of the current canvas content."""
         return self._image.copy()
 
-    def _draw_point(self, point: QPoint) -> None:
-        painter = QPainter(self._image)
-        painter.setPen(self._pen)
-        p = self._clamp_to_canvas(point)
-        painter.drawPoint(p)
-        self.update()
-        self.drawing_changed.emit()
-
-    def _clamp_to_canvas(self, point: QPoint) -> QPoint:
-        x = max(0, min(point.x(), self._image.width() - 1))
-        y = max(0, min(point.y(), self._image.height() - 1))
-        return QPoint(x, y)
+    def _draw_point(self, x: int, y: int) -> None:
+        painter = self._ensure_painter()
+        painter.drawPoint(x, y)
+        pen_w = self._pen.width()
+        self._revision += 1
+        self.update(QRect(x - pen_w, y - pen_w, 2 * pen_w + 1, 2 * pen_w + 1))
+        if not self._changed_timer.isActive():
+            self._changed_timer.start()
+
+    def _clamp_to_canvas(self, x: int, y: int) -> tuple[int, int]:
+        return (
+            max(0, min(x, self._image.width() - 1)),
+            max(0, min(y, self._image.height() - 1)),
+        )
@@ -1,17 +1,20 @@
 import os
+import re
 from pathlib import Path
 
+# KEY=VALUE lines, comments and blanks skipped; the regex does the line
+# splitting, filtering and trimming in one C-level pass.
+_ENV_LINE = re.compile(r"^[ \t]*([^#=\s][^=]*?)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
+
 _env_file = Path(__file__).resolve().parent / ".env"
 if _env_file.is_file():
-    for line in _env_file.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        key, _, value = line.partition("=")
-        os.environ.setdefault(key.strip(), value.strip())
-
-from app.ui.main_window import run_app
-
+    for key, value in _ENV_LINE.findall(_env_file.read_text(encoding="utf-8")):
+        os.environ.setdefault(key, value)
 
 if __name__ == "__main__":
+    # Imported here on purpose: app.ui.main_window transitively pulls in
+    # all of PyQt5 and every page module, which dominates startup cost,
+    # so only the actual app launch pays for it.
+    from app.ui.main_window import run_app
+
     run_app()